@@ -0,0 +1,3 @@
+from dxpars.compare import diff
+
+__all__ = ['diff']
@@ -1,10 +1,13 @@
 """Docx xml objects"""
 
 from abc import ABC, abstractmethod
-from typing import Any, Generator, Optional
+from typing import Any, Generator, MutableMapping, Optional
+from weakref import WeakValueDictionary
 
 from lxml.etree import ElementBase, tostring
 
+from dxpars.data import detach
+
 
 class XmlElement(object):
     """XML docx_document part."""
@@ -34,10 +37,54 @@ class XmlElement(object):
         return f'{self.namespace}{tag}'
 
 
+class ParseContext(object):
+    """Parsing options and package data shared by all document objects."""
+
+    def __init__(
+        self,
+        rels: Optional[Any] = None,
+        styles: Optional[Any] = None,
+        insertions: bool = True,
+        deletions: bool = False,
+        formats: Optional[MutableMapping] = None,
+    ):
+        """
+        Create ParseContext instance.
+
+        Args:
+            rels: document relationships
+            styles: document styles
+            insertions: include text of tracked insertions
+            deletions: include text of tracked deletions
+            formats: pool of shared format objects
+        """
+        self.rels = rels
+        self.styles = styles
+        self.formats = {} if formats is None else formats
+        self.insertions = insertions
+        self.deletions = deletions
+        containers = [
+            'sdt', 'sdtContent', 'customXml', 'smartTag', 'hyperlink', 'fldSimple',
+        ]
+        if insertions:
+            containers.extend(['ins', 'moveTo'])
+        if deletions:
+            containers.extend(['del', 'moveFrom'])
+        self.containers = frozenset(
+            f'{XmlElement.namespace}{tag}' for tag in containers
+        )
+
+
 class DocxPart(ABC, XmlElement):
     """Doc object."""
 
-    def __init__(self, xml_element: ElementBase, formatting, nodes=None):
+    def __init__(
+        self,
+        xml_element: ElementBase,
+        formatting,
+        nodes=None,
+        context: Optional[ParseContext] = None,
+    ):
         """
         Create Document object instance.
 
@@ -45,12 +92,14 @@ class DocxPart(ABC, XmlElement):
             xml_element: xml tree
             formatting: xml with formatting
             nodes: list of nodes to parse
+            context: shared parsing context
 
         """
         super().__init__(xml_element=xml_element)
+        self.context = default_context if context is None else context
         self._nodes = [] if nodes is None else list(self._cut_nodes(nodes=nodes))
-        self.formatting = next(
-            self._cut_nodes(nodes=(formatting, )), formatting(xml_element=None),
+        self.formatting = None if formatting is None else self._find_formatting(
+            formatting=formatting,
         )
 
     def __str__(self) -> str:
@@ -78,6 +127,21 @@ class DocxPart(ABC, XmlElement):
 
         return self._nodes or self.text
 
+    def detach(self, frozen: bool = False):
+        """
+        Copy text and properties into objects without xml.
+
+        Detached objects (see dxpars.data) have the same read API and
+        are cheap to pickle, e.g. to return them from worker processes.
+
+        Args:
+            frozen: keep child nodes in tuples instead of lists
+
+        Raises:
+            TypeError: if the object has no detached counterpart
+        """
+        return detach(part=self, frozen=frozen)
+
     @property
     def to_dict(self) -> dict[str, Any]:
         """Get dictionary representation of the object."""
@@ -91,15 +155,40 @@ class DocxPart(ABC, XmlElement):
         }
 
     def _cut_nodes(self, nodes) -> Generator:
+        """Collect child nodes, descending into transparent containers."""
+
         nodes = {self._make_tag(tag=node.tag): node for node in nodes}
+        containers = self.context.containers
+        stack = [iter(self._xml)]
+        while stack:
+            for xml_node in stack[-1]:
+                node_object = nodes.get(xml_node.tag)
+                if node_object is not None:
+                    yield node_object(xml_element=xml_node, context=self.context)
+                elif xml_node.tag in containers:
+                    stack.append(iter(xml_node))
+                    break
+            else:
+                stack.pop()
+
+    def _find_formatting(self, formatting):
+        tag = self._make_tag(tag=formatting.tag)
         for xml_node in self._xml:
-            node_object = nodes.get(xml_node.tag)
-            if node_object is not None:
-                yield node_object(xml_element=xml_node)
+            if xml_node.tag == tag:
+                return formatting.shared(xml_element=xml_node, pool=self.context.formats)
+        return formatting.shared(xml_element=None, pool=self.context.formats)
+
+
+default_context = ParseContext(formats=WeakValueDictionary())
 
 
 class FormatElement(XmlElement):
-    """Doc object format."""
+    """
+    Doc object format.
+
+    Formats created with `shared` are pooled by content: equal formatting
+    xml gives the same object, so formats must be treated as read-only.
+    """
 
     def __init__(self, xml_element: ElementBase):
         """
@@ -110,6 +199,62 @@ class FormatElement(XmlElement):
         """
         super().__init__(xml_element=xml_element)
         self.properties = self._extract_tags_data(element=self._xml)
+        self._key = None
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FormatElement):
+            return NotImplemented
+        return self is other or self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    @classmethod
+    def shared(
+        cls, xml_element: Optional[ElementBase], pool: MutableMapping,
+    ) -> 'FormatElement':
+        """
+        Get pooled format object equal to the xml.
+
+        Args:
+            xml_element: xml tree
+            pool: format objects by key
+        """
+        key = (cls, cls.freeze(element=xml_element))
+        format_element = pool.get(key)
+        if format_element is None:
+            format_element = cls(xml_element=xml_element)
+            format_element._key = key
+            pool[key] = format_element
+        return format_element
+
+    @classmethod
+    def freeze(cls, element: Optional[ElementBase]) -> tuple:
+        """
+        Get hashable representation of the formatting xml.
+
+        Args:
+            element: xml tree
+        """
+        if element is None:
+            return ()
+        return tuple(
+            (
+                node.tag,
+                tuple(sorted(node.attrib.items())) if node.attrib else (),
+                cls.freeze(element=node) if len(node) else (),
+            )
+            for node in element
+            if isinstance(node.tag, str)
+        )
+
+    @property
+    def key(self) -> tuple:
+        """Get format key, equal for formats with the same xml content."""
+
+        if self._key is None:
+            self._key = (self.__class__, self.freeze(element=self._xml))
+        return self._key
 
     @classmethod
     def extract_tag(cls, node: str) -> str:
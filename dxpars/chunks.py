@@ -0,0 +1,185 @@
+"""Splitting documents into heading or section chunks."""
+
+from typing import Iterable, Iterator, Optional
+
+from dxpars.styles import Styles
+
+CHUNK_MODES = ('heading', 'section')
+PARAGRAPH_TAG = 'p'
+
+
+class Chunk(object):
+    """Document text chunk."""
+
+    __slots__ = ('text', 'headings', 'section', 'start', 'end')
+
+    def __init__(
+        self, text: str, headings: tuple, section: int, start: int, end: int,
+    ):
+        """
+        Create Chunk instance.
+
+        Args:
+            text: chunk text
+            headings: heading path of the chunk, from the top level
+            section: document section index
+            start: index of the first body block of the chunk
+            end: index of the last body block of the chunk
+        """
+        self.text = text
+        self.headings = headings
+        self.section = section
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({self.headings}, {len(self.text)} chars)'
+
+    __repr__ = __str__
+
+    @property
+    def to_dict(self) -> dict:
+        """Get dictionary representation of the chunk."""
+
+        return {
+            'text': self.text,
+            'headings': list(self.headings),
+            'section': self.section,
+            'start': self.start,
+            'end': self.end,
+        }
+
+
+def iter_chunks(
+    blocks: Iterable,
+    by: str = 'heading',
+    max_chars: Optional[int] = None,
+    overlap: int = 0,
+    styles: Optional[Styles] = None,
+) -> Iterator[Chunk]:
+    """
+    Split body blocks into chunks in one pass.
+
+    Args:
+        blocks: body blocks (paragraphs and tables), may be a stream
+        by: start chunks at each heading ('heading') or section ('section')
+        max_chars: maximum chunk length, long chunks are split between
+            blocks and long blocks at whitespace
+        overlap: number of characters of the previous piece repeated at
+            the start of the next piece of the same chunk
+        styles: document styles for heading levels
+
+    Yields:
+        Chunks with heading path metadata.
+    """
+    if by not in CHUNK_MODES:
+        raise ValueError(f'Unknown chunk mode: {by}, expected one of {CHUNK_MODES}')
+    if max_chars is not None and not 0 <= overlap < max_chars:
+        raise ValueError('overlap must be less than max_chars')
+    if styles is None:
+        styles = Styles(xml_element=None)
+
+    outline = []
+    pieces = None
+    section = 0
+    for block_idx, block in enumerate(blocks):
+        is_paragraph = block.tag == PARAGRAPH_TAG
+        level = heading_level(paragraph=block, styles=styles) if is_paragraph else None
+        text = block.text
+        if level is not None:
+            if by == 'heading' and pieces is not None:
+                yield from pieces.close()
+                pieces = None
+            while outline and outline[-1][0] >= level:
+                outline.pop()
+            outline.append((level, text))
+        if pieces is None:
+            headings = tuple(heading for _, heading in outline)
+            pieces = _Pieces(headings, section, max_chars, overlap)
+        yield from pieces.add(block_idx=block_idx, text=text)
+        if is_paragraph and block.section_break:
+            yield from pieces.close()
+            pieces = None
+            section += 1
+    if pieces is not None:
+        yield from pieces.close()
+
+
+def heading_level(paragraph, styles: Styles) -> Optional[int]:
+    """
+    Get heading level of a paragraph.
+
+    Args:
+        paragraph: paragraph object
+        styles: document styles
+    """
+    level = paragraph.outline_level
+    if level is None and paragraph._outline_level is None:
+        # explicit body text level of the paragraph is not resolved by style
+        return styles.outline_level(style_id=paragraph.pstyle)
+    return level
+
+
+class _Pieces(object):
+    """Chunk under construction, yields finished pieces as blocks are added."""
+
+    __slots__ = (
+        'headings', 'section', 'max_chars', 'overlap',
+        'previous', 'segments', 'length', 'start', 'end',
+    )
+
+    def __init__(
+        self, headings: tuple, section: int, max_chars: Optional[int], overlap: int,
+    ):
+        self.headings = headings
+        self.section = section
+        self.max_chars = max_chars
+        self.overlap = overlap
+        self.previous = ''
+        self.segments = []
+        self.length = 0
+        self.start = None
+        self.end = None
+
+    def add(self, block_idx: int, text: str) -> Iterator[Chunk]:
+        if self.start is None:
+            self.start = block_idx
+        if self.max_chars is None:
+            self.segments.append(text)
+            self.end = block_idx
+            return
+        budget = self.max_chars - self.overlap
+        for segment in _split_text(text=text, size=budget):
+            added = len(segment) + 1 if self.segments else len(segment)
+            if self.segments and self.length + added > budget:
+                yield self._chunk()
+                # only the overlap tail of a finished piece is kept
+                self.previous = '\n'.join(self.segments)[-self.overlap:] if self.overlap else ''
+                self.segments, self.length, self.start = [], 0, block_idx
+                added = len(segment)
+            self.segments.append(segment)
+            self.length += added
+            self.end = block_idx
+
+    def close(self) -> Iterator[Chunk]:
+        if self.start is not None:
+            yield self._chunk()
+
+    def _chunk(self) -> Chunk:
+        return Chunk(
+            text=self.previous + '\n'.join(self.segments),
+            headings=self.headings,
+            section=self.section,
+            start=self.start,
+            end=self.end,
+        )
+
+
+def _split_text(text: str, size: int) -> Iterator[str]:
+    while len(text) > size:
+        cut = text.rfind(' ', 0, size + 1)
+        if cut <= 0:
+            cut = size
+        yield text[:cut]
+        text = text[cut:].lstrip(' ')
+    yield text
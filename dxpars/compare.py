@@ -0,0 +1,303 @@
+"""Structural diff between two parsed documents."""
+
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Iterator, Optional, Sequence
+
+PARAGRAPH_TAG = 'p'
+TABLE_TAG = 'tbl'
+
+
+class Change(object):
+    """
+    Difference between two document objects.
+
+    Kinds:
+        insert: object is only in the second document
+        delete: object is only in the first document
+        replace: object text changed
+        format: text is equal, properties changed
+    """
+
+    __slots__ = ('kind', 'a_index', 'b_index', 'a', 'b', 'properties', 'parts')
+
+    def __init__(
+        self,
+        kind: str,
+        a_index=None,
+        b_index=None,
+        a=None,
+        b=None,
+        properties: Optional[dict] = None,
+        parts: Optional[list] = None,
+    ):
+        """
+        Create Change instance.
+
+        Args:
+            kind: insert, delete, replace or format
+            a_index: index in the first document (block, run, or (row, cell))
+            b_index: index in the second document
+            a: object of the first document
+            b: object of the second document
+            properties: changed properties, name -> (old, new)
+            parts: changes of runs (paragraphs) or cells (tables)
+        """
+        self.kind = kind
+        self.a_index = a_index
+        self.b_index = b_index
+        self.a = a
+        self.b = b
+        self.properties = {} if properties is None else properties
+        self.parts = [] if parts is None else parts
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({self.kind}, {self.a_index}, {self.b_index})'
+
+    __repr__ = __str__
+
+    @property
+    def a_text(self) -> Optional[str]:
+        return None if self.a is None else self.a.text
+
+    @property
+    def b_text(self) -> Optional[str]:
+        return None if self.b is None else self.b.text
+
+    @property
+    def to_dict(self) -> dict[str, Any]:
+        """Get dictionary representation of the change."""
+
+        return {
+            'kind': self.kind,
+            'a_index': self.a_index,
+            'b_index': self.b_index,
+            'a_text': self.a_text,
+            'b_text': self.b_text,
+            'properties': dict(self.properties),
+            'parts': [part.to_dict for part in self.parts],
+        }
+
+
+def diff(doc_a, doc_b) -> list[Change]:
+    """
+    Compare body blocks of two documents.
+
+    Blocks are keyed by text and properties and aligned on the keys in
+    near-linear time (patience alignment), only changed blocks are compared in depth: paragraphs run by run,
+    tables cell by cell.
+
+    Args:
+        doc_a: first document (Document, DocumentData or body)
+        doc_b: second document
+
+    Returns:
+        Changes in document order.
+    """
+    blocks_a, blocks_b = doc_a.parts, doc_b.parts
+    if isinstance(blocks_a, str):
+        blocks_a = []
+    if isinstance(blocks_b, str):
+        blocks_b = []
+    return list(_diff_sequence(blocks_a, blocks_b, compare=_compare_block))
+
+
+def signature(part) -> tuple:
+    """
+    Get hashable content of a doc object: tag, properties, text or children.
+
+    Args:
+        part: doc object or detached object
+    """
+    nodes = part._nodes
+    return (
+        part.tag,
+        _freeze(value=part.properties),
+        tuple(signature(part=node) for node in nodes) if nodes else part.text,
+    )
+
+
+def _align(items_a: Sequence, items_b: Sequence) -> Iterator[tuple]:
+    """Yield (a_index, b_index) of changed items, None for a missing side."""
+
+    # equal signatures get equal integer keys, compared without rehashing
+    ids = {}
+    keys_a = [ids.setdefault(signature(part=item), len(ids)) for item in items_a]
+    keys_b = [ids.setdefault(signature(part=item), len(ids)) for item in items_b]
+
+    prev_a = prev_b = 0
+    for a_idx, b_idx in _matches(keys_a=keys_a, keys_b=keys_b) + [(len(keys_a), len(keys_b))]:
+        if a_idx > prev_a or b_idx > prev_b:
+            yield from _pair(items_a, items_b, prev_a, a_idx, prev_b, b_idx)
+        prev_a, prev_b = a_idx + 1, b_idx + 1
+
+
+def _matches(keys_a: list, keys_b: list) -> list[tuple]:
+    """
+    Get (a_index, b_index) of equal items in increasing order.
+
+    Patience alignment: equal head and tail are matched, then keys
+    occurring once on both sides are anchors (longest increasing run of
+    them), then the gaps between anchors are aligned the same way. Gaps
+    without unique keys are anchored on the least repeated common key,
+    occurrences matched in order, so repeated blocks (empty paragraphs)
+    do not make the alignment quadratic.
+    """
+    matches = []
+    ranges = [(0, len(keys_a), 0, len(keys_b))]
+    while ranges:
+        a1, a2, b1, b2 = ranges.pop()
+        while a1 < a2 and b1 < b2 and keys_a[a1] == keys_b[b1]:
+            matches.append((a1, b1))
+            a1 += 1
+            b1 += 1
+        while a2 > a1 and b2 > b1 and keys_a[a2 - 1] == keys_b[b2 - 1]:
+            a2 -= 1
+            b2 -= 1
+            matches.append((a2, b2))
+        if a1 == a2 or b1 == b2:
+            continue
+        prev_a, prev_b = a1, b1
+        for a_idx, b_idx in _anchors(keys_a, keys_b, a1, a2, b1, b2):
+            matches.append((a_idx, b_idx))
+            ranges.append((prev_a, a_idx, prev_b, b_idx))
+            prev_a, prev_b = a_idx + 1, b_idx + 1
+        if prev_a != a1:
+            ranges.append((prev_a, a2, prev_b, b2))
+    matches.sort()
+    return matches
+
+
+def _anchors(keys_a, keys_b, a1, a2, b1, b2) -> list[tuple]:
+    counts_a = Counter(keys_a[a1:a2])
+    counts_b = Counter(keys_b[b1:b2])
+    common = [key for key in counts_a if key in counts_b]
+    if not common:
+        return []
+    rarest = min(max(counts_a[key], counts_b[key]) for key in common)
+    if rarest > 1:
+        key = min(common, key=lambda key: max(counts_a[key], counts_b[key]))
+        return list(
+            zip(
+                [idx for idx in range(a1, a2) if keys_a[idx] == key],
+                [idx for idx in range(b1, b2) if keys_b[idx] == key],
+            ),
+        )
+    positions_b = {
+        keys_b[idx]: idx for idx in range(b1, b2) if counts_b[keys_b[idx]] == 1
+    }
+    pairs = [
+        (idx, positions_b[keys_a[idx]])
+        for idx in range(a1, a2)
+        if counts_a[keys_a[idx]] == 1 and keys_a[idx] in positions_b
+    ]
+    return _increasing(pairs=pairs)
+
+
+def _increasing(pairs: list[tuple]) -> list[tuple]:
+    """Get longest run of pairs with increasing b index (patience sort)."""
+
+    tails = []
+    tail_b = []
+    previous = [None] * len(pairs)
+    for idx, (_, b_idx) in enumerate(pairs):
+        pile = bisect_left(tail_b, b_idx)
+        previous[idx] = tails[pile - 1] if pile else None
+        if pile == len(tails):
+            tails.append(idx)
+            tail_b.append(b_idx)
+        else:
+            tails[pile] = idx
+            tail_b[pile] = b_idx
+    result = []
+    idx = tails[-1] if tails else None
+    while idx is not None:
+        result.append(pairs[idx])
+        idx = previous[idx]
+    return result[::-1]
+
+
+def _pair(items_a, items_b, a1, a2, b1, b2) -> Iterator[tuple]:
+    """Pair changed items of the same kind (paragraph, table) in order."""
+
+    tags_left = Counter(item.tag for item in items_b[b1:b2])
+    a_idx, b_idx = a1, b1
+    while a_idx < a2 and b_idx < b2:
+        tag_a, tag_b = items_a[a_idx].tag, items_b[b_idx].tag
+        if tag_a == tag_b:
+            yield a_idx, b_idx
+            a_idx += 1
+        elif tags_left[tag_a]:
+            yield None, b_idx
+        else:
+            yield a_idx, None
+            a_idx += 1
+            continue
+        tags_left[tag_b] -= 1
+        b_idx += 1
+    for a_idx in range(a_idx, a2):
+        yield a_idx, None
+    for b_idx in range(b_idx, b2):
+        yield None, b_idx
+
+
+def _diff_sequence(items_a: Sequence, items_b: Sequence, compare) -> Iterator[Change]:
+    for a_idx, b_idx in _align(items_a=items_a, items_b=items_b):
+        if b_idx is None:
+            yield Change(kind='delete', a_index=a_idx, a=items_a[a_idx])
+        elif a_idx is None:
+            yield Change(kind='insert', b_index=b_idx, b=items_b[b_idx])
+        else:
+            yield compare(items_a[a_idx], items_b[b_idx], a_idx, b_idx)
+
+
+def _compare_block(block_a, block_b, a_index, b_index) -> Change:
+    if block_a.tag == PARAGRAPH_TAG:
+        parts = list(_diff_sequence(block_a._nodes, block_b._nodes, compare=_make_change))
+    elif block_a.tag == TABLE_TAG:
+        parts = list(_diff_cells(table_a=block_a, table_b=block_b))
+    else:
+        parts = []
+    return _make_change(block_a, block_b, a_index, b_index, parts=parts)
+
+
+def _diff_cells(table_a, table_b) -> Iterator[Change]:
+    rows_a, rows_b = table_a._nodes, table_b._nodes
+    for a_row, b_row in _align(items_a=rows_a, items_b=rows_b):
+        cells_a = [] if a_row is None else rows_a[a_row]._nodes
+        cells_b = [] if b_row is None else rows_b[b_row]._nodes
+        for cell_idx in range(max(len(cells_a), len(cells_b))):
+            if cell_idx >= len(cells_b):
+                yield Change(kind='delete', a_index=(a_row, cell_idx), a=cells_a[cell_idx])
+            elif cell_idx >= len(cells_a):
+                yield Change(kind='insert', b_index=(b_row, cell_idx), b=cells_b[cell_idx])
+            elif signature(part=cells_a[cell_idx]) != signature(part=cells_b[cell_idx]):
+                yield _make_change(
+                    cells_a[cell_idx], cells_b[cell_idx], (a_row, cell_idx), (b_row, cell_idx),
+                )
+
+
+def _make_change(part_a, part_b, a_index, b_index, parts=None) -> Change:
+    props_a, props_b = part_a.properties or {}, part_b.properties or {}
+    properties = {
+        name: (props_a.get(name), props_b.get(name))
+        for name in {**props_a, **props_b}
+        if props_a.get(name) != props_b.get(name)
+    }
+    return Change(
+        kind='format' if part_a.text == part_b.text else 'replace',
+        a_index=a_index,
+        b_index=b_index,
+        a=part_a,
+        b=part_b,
+        properties=properties,
+        parts=parts,
+    )
+
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(value=item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(value=item) for item in value)
+    return value
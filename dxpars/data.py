@@ -0,0 +1,470 @@
+"""Detached document objects without xml."""
+
+from typing import Any, Optional
+
+BODY_TEXT_LEVEL = 9
+
+
+class PartData(object):
+    """
+    Detached doc object.
+
+    Pickled state is a tuple of slot values. Detached objects with equal
+    properties share one properties dict, which pickle writes once.
+    """
+
+    __slots__ = ('_nodes', '_properties')
+
+    tag: str
+    object_name: str
+    state = ('_properties', '_nodes')
+
+    def __init__(self, properties: Optional[dict], nodes: Optional[list] = None):
+        """
+        Create PartData instance.
+
+        Args:
+            properties: object properties
+            nodes: child objects
+        """
+        self._properties = properties
+        self._nodes = [] if nodes is None else nodes
+
+    def __str__(self) -> str:
+        """Object representation."""
+
+        return f'{self.__class__.__name__} at {id(self)}'
+
+    __repr__ = __str__
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, slot) for slot in self.state)
+
+    def __setstate__(self, state: tuple):
+        self._nodes = []
+        for slot, value in zip(self.state, state):
+            setattr(self, slot, value)
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.to_dict == other.to_dict
+
+    __hash__ = None
+
+    @property
+    def properties(self) -> Optional[dict]:
+        """Get object properties."""
+
+        if self._properties is None:
+            return None
+        return {name: _copied(value) for name, value in self._properties.items()}
+
+    @property
+    def parts(self):
+        """Get child nodes or text of the object."""
+
+        return self._nodes or self.text
+
+    @property
+    def text(self) -> str:
+        """Get object text."""
+
+        return '\n'.join([part.text for part in self._nodes])
+
+    @property
+    def show(self):
+        """Get object structure."""
+
+        return [part.show for part in self._nodes]
+
+    @property
+    def to_dict(self) -> dict[str, Any]:
+        """Get dictionary representation of the object."""
+
+        return {
+            'object': self.object_name,
+            'properties': self.properties,
+            'parts': {
+                idx: part.to_dict for idx, part in enumerate(self._nodes)
+            } if self._nodes else self.text,
+        }
+
+    def detach(self, frozen: bool = False) -> 'PartData':
+        """
+        Copy the object.
+
+        Args:
+            frozen: keep child nodes in tuples instead of lists
+        """
+        return detach(part=self, frozen=frozen)
+
+    def _property(self, name: str):
+        return _copied(self._properties[name])
+
+
+class RunData(PartData):
+    """Detached Run."""
+
+    __slots__ = ('_text',)
+
+    tag = 'r'
+    object_name = 'Run'
+    state = ('_properties', '_text')
+
+    def __init__(self, text: str, properties: dict):
+        """
+        Create RunData instance.
+
+        Args:
+            text: run text
+            properties: run properties
+        """
+        super().__init__(properties=properties)
+        self._text = text
+
+    @property
+    def text(self) -> str:
+        """Get Run text."""
+
+        return self._text
+
+    @property
+    def show(self) -> str:
+        """Get Run text."""
+
+        return self._text
+
+    @property
+    def bold(self) -> bool:
+        return self._property(name='bold')
+
+    @property
+    def italic(self) -> bool:
+        return self._property(name='italic')
+
+    @property
+    def underline(self) -> bool:
+        return self._property(name='underline')
+
+    @property
+    def caps(self) -> bool:
+        return self._property(name='caps')
+
+
+class ParagraphData(PartData):
+    """Detached Paragraph."""
+
+    __slots__ = ('_outline_level', '_section_break')
+
+    tag = 'p'
+    object_name = 'Paragraph'
+    state = PartData.state + __slots__
+
+    def __init__(
+        self,
+        properties: dict,
+        nodes: Optional[list] = None,
+        outline_level: Optional[int] = None,
+        section_break: bool = False,
+    ):
+        """
+        Create ParagraphData instance.
+
+        Args:
+            properties: paragraph properties
+            nodes: paragraph runs
+            outline_level: heading level of the paragraph, BODY_TEXT_LEVEL
+                if the paragraph is explicitly body text
+            section_break: paragraph ends a document section
+        """
+        super().__init__(properties=properties, nodes=nodes)
+        self._outline_level = outline_level
+        self._section_break = section_break
+
+    @property
+    def text(self) -> str:
+        """Get paragraph text."""
+
+        return ''.join(run.text for run in self._nodes)
+
+    @property
+    def show(self) -> str:
+        return self.text
+
+    @property
+    def bold(self) -> bool:
+        return self._property(name='bold')
+
+    @property
+    def italic(self) -> bool:
+        return self._property(name='italic')
+
+    @property
+    def underline(self) -> bool:
+        return self._property(name='underline')
+
+    @property
+    def caps(self) -> bool:
+        return self._property(name='caps')
+
+    @property
+    def bullet(self) -> bool:
+        return self._property(name='bullet')
+
+    @property
+    def alignment(self) -> str:
+        return self._property(name='alignment')
+
+    @property
+    def pstyle(self) -> Optional[str]:
+        return self._property(name='pstyle')
+
+    @property
+    def outline_level(self) -> Optional[int]:
+        level = self._outline_level
+        return level if level is not None and level < BODY_TEXT_LEVEL else None
+
+    @property
+    def section_break(self) -> bool:
+        return self._section_break
+
+    def _bold(self, texts: list[str]) -> bool:
+        return self._property(name='bold')
+
+    def _caps(self, text: str) -> bool:
+        return self._property(name='caps')
+
+
+class TableData(PartData):
+    """Detached Table."""
+
+    __slots__ = ()
+
+    tag = 'tbl'
+    object_name = 'Table'
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self._property(name='shape')
+
+    @property
+    def show(self) -> dict:
+        """Get Table representation as a dict."""
+
+        return {row_idx: row.show for row_idx, row in enumerate(self._nodes)}
+
+    @property
+    def expand(self) -> dict:
+        """Expand horizontally merged cells."""
+
+        return {idx: row.expand for idx, row in enumerate(self._nodes)}
+
+
+class RowData(PartData):
+    """Detached table Row."""
+
+    __slots__ = ()
+
+    tag = 'tr'
+    object_name = 'Row'
+    cell_width = 10
+
+    @property
+    def text(self) -> str:
+        """Get Table Row text. Unmerges horizontally merged cells"""
+
+        return '\t'.join(
+            cell.text.ljust(self.cell_width) for cell in self.expand.values()
+        )
+
+    @property
+    def show(self) -> dict:
+        """Return row cells in table structure form."""
+
+        row_cells = {}
+        cell_idx = 0
+        for cell in self._nodes:
+            merged, first = cell.v_merge
+            if merged and not first:
+                cell_idx += cell.h_merge
+                continue
+            row_cells[cell_idx] = cell.show
+            cell_idx += cell.h_merge
+        return row_cells
+
+    @property
+    def length(self) -> int:
+        return len(self.expand)
+
+    @property
+    def expand(self) -> dict:
+        """Expand horizontally merged cells."""
+
+        row_data = {}
+        shift = 0
+        for cell in self._nodes:
+            for _ in range(cell.h_merge):
+                row_data[shift] = cell
+                shift += 1
+        return row_data
+
+
+class BlocksData(PartData):
+    """Detached container of paragraphs and tables."""
+
+    __slots__ = ()
+
+    @property
+    def paragraphs(self) -> list[ParagraphData]:
+        return [node for node in self._nodes if node.tag == ParagraphData.tag]
+
+    @property
+    def tables(self) -> list[TableData]:
+        return [node for node in self._nodes if node.tag == TableData.tag]
+
+
+class CellData(BlocksData):
+    """Detached table Cell."""
+
+    __slots__ = ()
+
+    tag = 'tc'
+    object_name = 'Cell'
+
+    @property
+    def h_merge(self) -> int:
+        return self._property(name='h_merge')
+
+    @property
+    def v_merge(self) -> dict:
+        return self._property(name='v_merge')
+
+
+class BodyData(BlocksData):
+    """Detached document Body."""
+
+    __slots__ = ()
+
+    tag = 'body'
+    object_name = 'Body'
+
+
+class DocumentData(object):
+    """Detached document."""
+
+    __slots__ = ('filename', 'body', 'styles')
+
+    def __init__(self, filename: str, body: BodyData, styles=None):
+        """
+        Create DocumentData instance.
+
+        Args:
+            filename: document filename
+            body: document body
+            styles: document styles, None if not available
+        """
+        self.filename = filename
+        self.body = body
+        self.styles = styles
+
+    def __str__(self) -> str:
+        return f'{self.filename} at {id(self)}'
+
+    __repr__ = __str__
+
+    @property
+    def text(self) -> str:
+        return self.body.text
+
+    @property
+    def parts(self) -> list:
+        return self.body.parts
+
+    @property
+    def paragraphs(self) -> list[ParagraphData]:
+        return self.body.paragraphs
+
+    @property
+    def tables(self) -> list[TableData]:
+        return self.body.tables
+
+    @property
+    def to_dict(self) -> dict[str, Any]:
+        return {'name': self.filename, 'body': self.body.to_dict}
+
+
+DATA_CLASSES = {
+    data_class.tag: data_class
+    for data_class in (BodyData, ParagraphData, RunData, TableData, RowData, CellData)
+}
+
+
+def detach(part, frozen: bool = False) -> PartData:
+    """
+    Copy text and properties of a doc object into detached objects.
+
+    Args:
+        part: doc object
+        frozen: keep child nodes in tuples instead of lists
+
+    Raises:
+        TypeError: if the object has no detached counterpart
+    """
+    return _detach(part=part, frozen=frozen, properties={})
+
+
+def outline_level(paragraph) -> Optional[int]:
+    """
+    Get outline level of a paragraph as kept by ParagraphData.
+
+    Args:
+        paragraph: Paragraph or ParagraphData
+
+    Returns:
+        Heading level, BODY_TEXT_LEVEL if the paragraph is explicitly
+        body text, None if the paragraph has no level.
+    """
+    level = paragraph.outline_level
+    if level is None and paragraph._outline_level is not None:
+        return BODY_TEXT_LEVEL
+    return level
+
+
+def _detach(part, frozen: bool, properties: dict) -> PartData:
+    data_class = DATA_CLASSES.get(part.tag)
+    if data_class is None:
+        raise TypeError(f'{part.__class__.__name__} can not be detached')
+    part_properties = _shared(properties=part.properties, pool=properties)
+    if data_class is RunData:
+        return RunData(text=part.text, properties=part_properties)
+    nodes = [
+        _detach(part=node, frozen=frozen, properties=properties) for node in part._nodes
+    ]
+    if frozen:
+        nodes = tuple(nodes)
+    if data_class is ParagraphData:
+        return ParagraphData(
+            properties=part_properties,
+            nodes=nodes,
+            outline_level=outline_level(paragraph=part),
+            section_break=part.section_break,
+        )
+    return data_class(properties=part_properties, nodes=nodes)
+
+
+def _copied(value):
+    # nested values (cell merge data) are shared by frozen documents, only
+    # copies are handed out
+    return dict(value) if isinstance(value, dict) else value
+
+
+def _shared(properties: Optional[dict], pool: dict) -> Optional[dict]:
+    if properties is None:
+        return None
+    try:
+        key = tuple(properties.items())
+        return pool.setdefault(key, properties)
+    except TypeError:
+        # unhashable values (cell merge data)
+        return properties
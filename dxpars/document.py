@@ -1,32 +1,149 @@
 """Docx Document."""
 
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Any, IO, Optional, Union
-from zipfile import ZipFile
-
-from lxml import etree
+from threading import Lock
+from typing import Any, IO, Iterator, Optional, Pattern, Union
 
+from dxpars import parallel, snapshot
+from dxpars.base.base_objects import ParseContext
+from dxpars.chunks import Chunk, iter_chunks
+from dxpars.data import DocumentData
 from dxpars.docx_objects.body import Body
 from dxpars.docx_objects.paragraph import Paragraph
 from dxpars.docx_objects.table import Table
+from dxpars.export import HtmlWriter, MarkdownWriter
+from dxpars.frames import Frame, FrameBuilder
+from dxpars.index import Match, TextIndex
+from dxpars.media import Media
+from dxpars.offsets import Location, OffsetMap
+from dxpars.package import DOCUMENT_PATH, RELS_PATH, STYLES_PATH, Package
+from dxpars.parser import DEFAULT_PROFILE, ParserProfile
+from dxpars.relationships import Relationships
+from dxpars.styles import Styles
 
 
 class Document(object):
-    """Parsed docx document."""
+    """
+    Parsed docx document.
+
+    Lazily built data (index, offsets, frames, media) is built once under a
+    lock per cache. A frozen document (see `freeze`) can be shared by
+    reader threads.
+    """
+
+    caches = ('_index', '_offsets', '_frames', '_media')
 
     def __init__(
-        self, file_or_path: Union[str, IO], filename: Optional[str] = None,
+        self,
+        file_or_path: Union[str, IO, Package],
+        filename: Optional[str] = None,
+        insertions: bool = True,
+        deletions: bool = False,
+        profile: Optional[ParserProfile] = None,
     ) -> None:
         """
         Docx Document instance.
 
         Args:
-            file_or_path: file or path to file
+            file_or_path: file or path to file, or an open package to
+                share between documents (not closed by the document)
             filename: filename (for IO)
+            insertions: include text of tracked insertions
+            deletions: include text of tracked deletions
+            profile: xml parser options and resource limits
+
+        Raises:
+            LimitError: if the document exceeds profile limits
         """
         self.filename = self._get_filename(path=file_or_path, filename=filename)
-        with ZipFile(file_or_path) as zipf:
-            self.body = Body(doc_tree=etree.fromstring(zipf.read('word/document.xml')))
+        session = (DEFAULT_PROFILE if profile is None else profile).session()
+        self._owns_package = not isinstance(file_or_path, Package)
+        self.package = Package(file_or_path) if self._owns_package else file_or_path
+        try:
+            self.rels = Relationships(
+                xml_element=self.package.xml(name=RELS_PATH, session=session),
+            )
+            self.styles = Styles(
+                xml_element=self.package.xml(name=STYLES_PATH, session=session),
+            )
+            doc_tree = session.parse(
+                content=self.package.read(name=DOCUMENT_PATH, session=session),
+            )
+        except BaseException:
+            self.close()
+            raise
+        self.context = ParseContext(
+            rels=self.rels,
+            styles=self.styles,
+            insertions=insertions,
+            deletions=deletions,
+        )
+        self.body = Body(doc_tree=doc_tree, context=self.context)
+        self._init_caches()
+
+    @classmethod
+    def load(cls, file_or_path: Union[str, IO]) -> 'Document':
+        """
+        Load document from a snapshot written by Document.dump.
+
+        Args:
+            file_or_path: binary file or path to file
+
+        Returns:
+            Document with detached body objects (no xml).
+        """
+        return cls._from_data(data=snapshot.load(file_or_path=file_or_path))
+
+    @classmethod
+    def parse_parallel(
+        cls,
+        file_or_path: Union[str, IO],
+        filename: Optional[str] = None,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        insertions: bool = True,
+        deletions: bool = False,
+        profile: Optional[ParserProfile] = None,
+    ) -> 'Document':
+        """
+        Parse document body in worker processes.
+
+        Args:
+            file_or_path: file or path to file
+            filename: filename (for IO)
+            workers: number of worker processes, defaults to CPU count
+            executor: executor to run body chunks on
+            insertions: include text of tracked insertions
+            deletions: include text of tracked deletions
+            profile: xml parser options and resource limits
+
+        Returns:
+            Document with detached body objects (no xml).
+        """
+        data = parallel.parse(
+            file_or_path=file_or_path,
+            filename=filename,
+            workers=workers,
+            executor=executor,
+            insertions=insertions,
+            deletions=deletions,
+            profile=profile,
+        )
+        return cls._from_data(data=data)
+
+    @classmethod
+    def _from_data(cls, data: DocumentData) -> 'Document':
+        document = cls.__new__(cls)
+        document.filename = data.filename
+        document.package = None
+        document._owns_package = False
+        document.rels = Relationships(xml_element=None)
+        document.styles = Styles(xml_element=None) if data.styles is None else data.styles
+        document.context = ParseContext(rels=document.rels, styles=document.styles)
+        document.body = data.body
+        document._init_caches()
+        return document
 
     def __str__(self) -> str:
         """
@@ -39,6 +156,66 @@ class Document(object):
 
     __repr__ = __str__
 
+    def __setattr__(self, name: str, value):
+        if getattr(self, '_frozen', False) and not name.startswith('_'):
+            raise AttributeError(f'Frozen document attribute is read-only: {name}')
+        super().__setattr__(name, value)
+
+    def __enter__(self) -> 'Document':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """
+        Close the package opened by the document.
+
+        Media streams and package parts are not available after.
+        """
+        if self._owns_package and self.package is not None:
+            self.package.close()
+
+    @property
+    def frozen(self) -> bool:
+        """Check document is frozen."""
+
+        return self._frozen
+
+    def freeze(self) -> 'Document':
+        """
+        Make the document read-only and safe to share between threads.
+
+        The body is replaced with detached objects (no xml, no lazily
+        computed formats, child nodes in tuples) and public attributes
+        can not be reassigned. Caches are still built on first use,
+        once, under their locks.
+
+        Detached objects keep text, properties, outline levels and
+        section breaks only: hyperlinks, drawings, formatting and
+        run_formats of the body objects are not available after.
+
+        Returns:
+            The document itself.
+        """
+        with self._locks['_frozen']:
+            if not self._frozen:
+                self.body = self.body.detach(frozen=True)
+                self._frozen = True
+        return self
+
+    @property
+    def media(self) -> Media:
+        """
+        Get images and embedded objects.
+
+        Returns:
+            Media parts streamed from the open document archive.
+        """
+        return self._cached(
+            name='_media', build=lambda: Media(package=self.package, rels=self.rels),
+        )
+
     @property
     def text(self) -> str:
         """
@@ -89,6 +266,130 @@ class Document(object):
         """
         return {'name': self.filename, 'body': self.body.to_dict}
 
+    def dump(self, file_or_path: Union[str, IO]):
+        """
+        Write compact binary snapshot of the parsed document.
+
+        Args:
+            file_or_path: binary file or path to file
+        """
+        snapshot.dump(document=self, file_or_path=file_or_path)
+
+    def build_index(self) -> TextIndex:
+        """
+        Build full-text index of paragraphs, including table cells.
+
+        Returns:
+            Document text index.
+        """
+        with self._locks['_index']:
+            self._index = TextIndex(blocks=self.body.parts)
+        return self._index
+
+    def find(self, term_or_regex: Union[str, Pattern]) -> list[Match]:
+        """
+        Find text in the document. Builds the index on first call.
+
+        Args:
+            term_or_regex: term or phrase (case-insensitive) or compiled regex
+
+        Returns:
+            Matches with paragraph, run and cell objects.
+        """
+        index = self._cached(
+            name='_index', build=lambda: TextIndex(blocks=self.body.parts),
+        )
+        return index.find(term_or_regex=term_or_regex)
+
+    def build_offsets(self) -> OffsetMap:
+        """
+        Extract document text with run offsets.
+
+        Returns:
+            Offset map, its text is equal to the document text.
+        """
+        with self._locks['_offsets']:
+            self._offsets = OffsetMap(blocks=self.body.parts)
+        return self._offsets
+
+    def locate(self, offset: int) -> Optional[Location]:
+        """
+        Find run, paragraph and cell at a document text offset.
+
+        Args:
+            offset: document text offset
+
+        Returns:
+            Location, None if the offset is a separator or cell padding.
+        """
+        offsets = self._cached(
+            name='_offsets', build=lambda: OffsetMap(blocks=self.body.parts),
+        )
+        return offsets.locate(offset=offset)
+
+    def runs_frame(self) -> Frame:
+        """
+        Get run properties as column arrays.
+
+        Returns:
+            Frame with block, paragraph, bold, italic, underline, caps and
+            length columns.
+        """
+        return self._build_frames().runs
+
+    def paragraphs_frame(self) -> Frame:
+        """
+        Get paragraph properties as column arrays.
+
+        Returns:
+            Frame with block, style, alignment, bold, italic, underline,
+            caps, bullet and length columns.
+        """
+        return self._build_frames().paragraphs
+
+    def iter_chunks(
+        self,
+        by: str = 'heading',
+        max_chars: Optional[int] = None,
+        overlap: int = 0,
+    ) -> Iterator[Chunk]:
+        """
+        Split document into heading or section chunks.
+
+        Args:
+            by: start chunks at each heading ('heading') or section ('section')
+            max_chars: maximum chunk length
+            overlap: number of characters repeated between pieces of a chunk
+
+        Returns:
+            Chunks with heading path metadata.
+        """
+        return iter_chunks(
+            blocks=self.body.parts,
+            by=by,
+            max_chars=max_chars,
+            overlap=overlap,
+            styles=self.styles,
+        )
+
+    def to_markdown(self, file_or_path: Union[str, IO[str]]):
+        """
+        Write document as Markdown, block by block.
+
+        Args:
+            file_or_path: text file or path to file
+        """
+        self._export(writer_class=MarkdownWriter, file_or_path=file_or_path)
+
+    def to_html(self, file_or_path: Union[str, IO[str]]):
+        """
+        Write document as HTML, block by block.
+
+        Args:
+            file_or_path: text file or path to file
+        """
+        self._export(writer_class=HtmlWriter, file_or_path=file_or_path)
+
     def to_txt(
         self,
         folder: str,
@@ -103,6 +404,36 @@ class Document(object):
             for part in self.body.parts:
                 file.write(f'{part.text}\n')
 
+    def _export(self, writer_class, file_or_path: Union[str, IO[str]]):
+        if isinstance(file_or_path, (str, Path)):
+            with open(file_or_path, 'w', encoding='utf-8') as file:
+                self._export(writer_class=writer_class, file_or_path=file)
+            return
+        writer_class(fp=file_or_path, styles=self.styles).write(
+            blocks=self.body.parts, title=self.filename,
+        )
+
+    def _init_caches(self):
+        self._frozen = False
+        self._locks = {name: Lock() for name in ('_frozen',) + self.caches}
+        for name in self.caches:
+            setattr(self, name, None)
+
+    def _cached(self, name: str, build):
+        value = getattr(self, name)
+        if value is None:
+            with self._locks[name]:
+                value = getattr(self, name)
+                if value is None:
+                    value = build()
+                    setattr(self, name, value)
+        return value
+
+    def _build_frames(self) -> FrameBuilder:
+        return self._cached(
+            name='_frames', build=lambda: FrameBuilder(blocks=self.body.parts),
+        )
+
     def _get_filename(self, path: Union[str, IO], filename: Optional[str]) -> str:
         """
         Get docx_document filename.
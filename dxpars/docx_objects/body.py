@@ -1,6 +1,8 @@
+from typing import Optional
+
 from lxml.etree import ElementBase
 
-from dxpars.base.base_objects import DocxPart
+from dxpars.base.base_objects import DocxPart, ParseContext
 from dxpars.docx_objects.paragraph import Paragraph
 from dxpars.docx_objects.table import Table
 from dxpars.format.paragraph import BodyFormat
@@ -11,17 +13,21 @@ class Body(DocxPart):
 
     tag = 'body'
 
-    def __init__(self, doc_tree: ElementBase):
+    def __init__(
+        self, doc_tree: ElementBase, context: Optional[ParseContext] = None,
+    ):
         """
         Create a body instance.
 
         Args:
             doc_tree: docx_document xml tree
+            context: shared parsing context
         """
         super().__init__(
             xml_element=doc_tree.find(self._make_tag(tag=self.tag)),
             formatting=BodyFormat,
             nodes=(Paragraph, Table),
+            context=context,
         )
 
     @property
@@ -4,8 +4,9 @@ from typing import Optional, Union
 
 from lxml.etree import ElementBase
 
-from dxpars.base.base_objects import DocxPart
+from dxpars.base.base_objects import DocxPart, ParseContext
 from dxpars.format.paragraph import ParagraphFormat, RunFormat
+from dxpars.styles import BODY_TEXT_LEVEL
 
 
 class Paragraph(DocxPart):
@@ -13,15 +14,21 @@ class Paragraph(DocxPart):
 
     tag = 'p'
 
-    def __init__(self, xml_element: ElementBase) -> None:
+    def __init__(
+        self, xml_element: ElementBase, context: Optional[ParseContext] = None,
+    ) -> None:
         """
         Create a paragraph instance.
 
         Args:
             xml_element: docx Paragraph
+            context: shared parsing context
         """
         super().__init__(
-            xml_element=xml_element, formatting=ParagraphFormat, nodes=(Run,),
+            xml_element=xml_element,
+            formatting=ParagraphFormat,
+            nodes=(Run,),
+            context=context,
         )
 
     @property
@@ -38,14 +45,7 @@ class Paragraph(DocxPart):
     def bold(self) -> bool:
         """Get bold format."""
 
-        if not self._nodes:
-            return self.formatting.has_run_with_format(tag='b')
-        bold_condition = (
-            run.bold
-            for run in self._nodes
-            if all([run.text, run.text not in ['\n', '\t']])
-        )
-        return all(bold_condition)
+        return self._bold(texts=[run.text for run in self._nodes])
 
     @property
     def italic(self) -> bool:
@@ -53,25 +53,26 @@ class Paragraph(DocxPart):
 
         if not self._nodes:
             return self.formatting.has_run_with_format(tag='i')
-        return all(run.italic for run in self._nodes)
+        return all(run_format.italic for run_format in self.run_formats)
 
     @property
     def underline(self) -> bool:
         """Get Underline format."""
         if not self._nodes:
             return self.formatting.has_run_with_format(tag='u')
-        return all(run.underline for run in self._nodes)
+        return all(run_format.underline for run_format in self.run_formats)
 
     @property
     def caps(self) -> bool:
         """Get Caps format."""
 
-        return any(
-            [
-                self.text.isupper(),
-                self._nodes and all(run.caps for run in self._nodes),
-            ],
-        )
+        return self._caps(text=self.text)
+
+    @property
+    def run_formats(self) -> set:
+        """Get distinct formats of paragraph runs."""
+
+        return {run.formatting for run in self._nodes}
 
     @property
     def bullet(self) -> bool:
@@ -91,6 +92,39 @@ class Paragraph(DocxPart):
 
         return self.formatting.get_tag_value(tag='pStyle')
 
+    @property
+    def outline_level(self) -> Optional[int]:
+        """
+        Get heading level (0-based) from paragraph or style outline level.
+
+        The style is used only if the paragraph has no outline level, an
+        explicit body text level is not overridden by the style.
+        """
+        level = self._outline_level
+        if level is None:
+            if self.context.styles is None:
+                return None
+            return self.context.styles.outline_level(style_id=self.pstyle)
+        return level if level < BODY_TEXT_LEVEL else None
+
+    @property
+    def _outline_level(self) -> Optional[int]:
+        return self.formatting.get_tag_value(tag='outlineLvl')
+
+    @property
+    def section_break(self) -> bool:
+        """Check paragraph ends a document section."""
+
+        return self.formatting.properties.get('sectPr') is not None
+
+    @property
+    def hyperlinks(self) -> list['Hyperlink']:
+        """Get paragraph hyperlinks."""
+
+        return [
+            Hyperlink(xml_element=node, context=self.context)
+            for node in self._xml.iter(self._make_tag(tag=Hyperlink.tag))
+        ]
 
     @property
     def properties(self) -> dict[str, Union[str, bool]]:
@@ -106,20 +140,49 @@ class Paragraph(DocxPart):
             'bullet': self.bullet,
         }
 
+    def _bold(self, texts: list[str]) -> bool:
+        """Get bold format from run texts."""
+
+        if not self._nodes:
+            return self.formatting.has_run_with_format(tag='b')
+        bold_condition = (
+            run.bold
+            for run, text in zip(self._nodes, texts)
+            if all([text, text not in ['\n', '\t']])
+        )
+        return all(bold_condition)
+
+    def _caps(self, text: str) -> bool:
+        """Get caps format from paragraph text."""
+
+        return any(
+            [
+                text.isupper(),
+                self._nodes and all(
+                    run_format.caps for run_format in self.run_formats
+                ),
+            ],
+        )
+
 
 class Run(DocxPart):
     """Run object."""
 
     tag = 'r'
 
-    def __init__(self, xml_element: ElementBase):
+    def __init__(
+        self, xml_element: ElementBase, context: Optional[ParseContext] = None,
+    ):
         """
         Create a paragraph Run instance.
 
         Args:
             xml_element: Run xml
+            context: shared parsing context
         """
-        super().__init__(xml_element=xml_element, formatting=RunFormat)
+        super().__init__(
+            xml_element=xml_element, formatting=RunFormat, context=context,
+        )
 
     @property
     def text(self) -> str:
@@ -129,6 +192,7 @@ class Run(DocxPart):
             f'{self.namespace}tab': '\t',
             f'{self.namespace}br': '\n',
             f'{self.namespace}t': 't',
+            f'{self.namespace}delText': 't',
         }
 
         text = []
@@ -150,24 +214,46 @@ class Run(DocxPart):
     def bold(self) -> bool:
         """Get Bold."""
 
-        return self._has_run_property(tag='b')
+        return self.formatting.bold
 
     @property
     def italic(self) -> bool:
         """Get Italic."""
-        return self._has_run_property(tag='i')
+        return self.formatting.italic
 
     @property
     def underline(self) -> bool:
         """Get Underline."""
 
-        return self.formatting.properties.get('u') is not None
+        return self.formatting.underline
 
     @property
     def caps(self) -> bool:
         """Get Caps."""
 
-        return self.formatting.properties.get('caps') is not None
+        return self.formatting.caps
+
+    @property
+    def drawings(self) -> list['Drawing']:
+        """Get pictures drawn in the run."""
+
+        return [
+            Drawing(xml_element=node, context=self.context)
+            for node in self._xml.iterchildren(self._make_tag(tag=Drawing.tag))
+        ]
+
+    @property
+    def hyperlink(self) -> Optional['Hyperlink']:
+        """Get the hyperlink containing the run."""
+
+        hyperlink_tag = self._make_tag(tag=Hyperlink.tag)
+        paragraph_tag = self._make_tag(tag=Paragraph.tag)
+        for node in self._xml.iterancestors():
+            if node.tag == hyperlink_tag:
+                return Hyperlink(xml_element=node, context=self.context)
+            if node.tag == paragraph_tag:
+                break
+        return None
 
     @property
     def properties(self) -> dict[str, bool]:
@@ -180,10 +266,139 @@ class Run(DocxPart):
             'caps': self.caps,
         }
 
-    def _has_run_property(self, tag: str) -> bool:
-        prop = self.formatting.properties.get(tag)
-        if prop is None:
-            return False
-        if not prop:
-            return True
-        return prop['val'].isdigit() and int(prop['val']) > 0
\ No newline at end of file
+
+class Hyperlink(DocxPart):
+    """Hyperlink object."""
+
+    tag = 'hyperlink'
+    rel_namespace = (
+        '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+    )
+
+    def __init__(
+        self, xml_element: ElementBase, context: Optional[ParseContext] = None,
+    ):
+        """
+        Create a Hyperlink instance.
+
+        Args:
+            xml_element: hyperlink xml
+            context: shared parsing context
+        """
+        super().__init__(
+            xml_element=xml_element, formatting=None, nodes=(Run,), context=context,
+        )
+
+    @property
+    def text(self) -> str:
+        """Get hyperlink text."""
+
+        return ''.join(run.text for run in self._nodes)
+
+    @property
+    def show(self) -> str:
+        return self.text
+
+    @property
+    def rid(self) -> Optional[str]:
+        """Get hyperlink relationship id."""
+
+        return self._xml.get(f'{self.rel_namespace}id')
+
+    @property
+    def anchor(self) -> Optional[str]:
+        """Get bookmark name for internal hyperlinks."""
+
+        return self._xml.get(self._make_tag(tag='anchor'))
+
+    @property
+    def target(self) -> Optional[str]:
+        """Get hyperlink target resolved from document relationships."""
+
+        rels = self.context.rels
+        if self.rid is not None and rels is not None:
+            return rels.target(self.rid)
+        if self.anchor is not None:
+            return f'#{self.anchor}'
+        return None
+
+    @property
+    def properties(self) -> dict[str, Optional[str]]:
+        """Get Hyperlink properties."""
+
+        return {'target': self.target, 'anchor': self.anchor}
+
+
+class Drawing(DocxPart):
+    """Drawing (picture) object."""
+
+    tag = 'drawing'
+    rel_namespace = Hyperlink.rel_namespace
+    drawing_namespace = (
+        '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}'
+    )
+    blip_tag = '{http://schemas.openxmlformats.org/drawingml/2006/main}blip'
+
+    def __init__(
+        self, xml_element: ElementBase, context: Optional[ParseContext] = None,
+    ):
+        """
+        Create a Drawing instance.
+
+        Args:
+            xml_element: drawing xml
+            context: shared parsing context
+        """
+        super().__init__(xml_element=xml_element, formatting=None, context=context)
+
+    @property
+    def text(self) -> str:
+        return ''
+
+    @property
+    def show(self) -> str:
+        return self.text
+
+    @property
+    def rid(self) -> Optional[str]:
+        """Get relationship id of the embedded picture."""
+
+        for blip in self._xml.iter(self.blip_tag):
+            return blip.get(f'{self.rel_namespace}embed')
+        return None
+
+    @property
+    def target(self) -> Optional[str]:
+        """Get package part name of the picture (e.g. word/media/image1.png)."""
+
+        rels = self.context.rels
+        if self.rid is None or rels is None:
+            return None
+        return rels.part_name(rid=self.rid)
+
+    @property
+    def name(self) -> Optional[str]:
+        """Get drawing name."""
+
+        return self._doc_property(name='name')
+
+    @property
+    def description(self) -> Optional[str]:
+        """Get drawing alternative text."""
+
+        return self._doc_property(name='descr')
+
+    @property
+    def properties(self) -> dict[str, Optional[str]]:
+        """Get Drawing properties."""
+
+        return {
+            'target': self.target,
+            'name': self.name,
+            'description': self.description,
+        }
+
+    def _doc_property(self, name: str) -> Optional[str]:
+        for doc_pr in self._xml.iter(f'{self.drawing_namespace}docPr'):
+            return doc_pr.get(name)
+        return None
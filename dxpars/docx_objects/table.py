@@ -1,8 +1,10 @@
 """docx Table docx_objects."""
 
+from typing import Optional
+
 from lxml.etree import ElementBase
 
-from dxpars.base.base_objects import DocxPart
+from dxpars.base.base_objects import DocxPart, ParseContext
 from dxpars.docx_objects.paragraph import Paragraph
 from dxpars.format.table import TableFormat, RowFormat, CellFormat
 
@@ -12,15 +14,21 @@ class Table(DocxPart):
 
     tag = 'tbl'
 
-    def __init__(self, xml_element: ElementBase):
+    def __init__(
+        self, xml_element: ElementBase, context: Optional[ParseContext] = None,
+    ):
         """
         Create a table  instance.
 
         Args:
             xml_element: table xml
+            context: shared parsing context
         """
         super().__init__(
-            xml_element=xml_element, formatting=TableFormat, nodes=(Row,),
+            xml_element=xml_element,
+            formatting=TableFormat,
+            nodes=(Row,),
+            context=context,
         )
 
     @property
@@ -61,22 +69,32 @@ class Row(DocxPart):
     """Row object."""
 
     tag = 'tr'
+    cell_width = 10
 
-    def __init__(self, xml_element: ElementBase):
+    def __init__(
+        self, xml_element: ElementBase, context: Optional[ParseContext] = None,
+    ):
         """
         Create a table row instance.
 
         Args:
             xml_element: row xml
+            context: shared parsing context
         """
-        super().__init__(xml_element=xml_element, formatting=RowFormat, nodes=(Cell,))
+        super().__init__(
+            xml_element=xml_element,
+            formatting=RowFormat,
+            nodes=(Cell,),
+            context=context,
+        )
 
     @property
     def text(self) -> str:
         """Get Table Row text. Unmerges horizontally merged cells"""
 
-        fixed_width = 10
-        return '\t'.join(cell.text.ljust(fixed_width) for cell in self.expand.values())
+        return '\t'.join(
+            cell.text.ljust(self.cell_width) for cell in self.expand.values()
+        )
 
     @property
     def show(self) -> dict:
@@ -126,17 +144,21 @@ class Cell(DocxPart):
 
     tag = 'tc'
 
-    def __init__(self, xml_element: ElementBase):
+    def __init__(
+        self, xml_element: ElementBase, context: Optional[ParseContext] = None,
+    ):
         """
         Create a table cell instance.
 
         Args:
             xml_element: cell xml
+            context: shared parsing context
         """
         super().__init__(
             xml_element=xml_element,
             formatting=CellFormat,
             nodes=(Paragraph, Table),
+            context=context,
         )
 
     @property
@@ -0,0 +1,320 @@
+"""Streaming Markdown and HTML export."""
+
+import re
+from abc import ABC, abstractmethod
+from html import escape
+from itertools import groupby
+from typing import IO, Iterable, Optional
+
+from dxpars.chunks import heading_level
+from dxpars.styles import Styles
+
+PARAGRAPH_TAG = 'p'
+TABLE_TAG = 'tbl'
+MAX_HEADING = 6
+MARKDOWN_SPECIAL = re.compile(r'([\\`*_\[\]<>|])')
+MARKDOWN_BLOCK_START = re.compile(r'^([#+-])')
+EMPHASIS = ('bold', 'italic', 'underline')
+HTML_EMPHASIS = {'bold': 'strong', 'italic': 'em', 'underline': 'u'}
+
+
+class Writer(ABC):
+    """Write body blocks to a text stream one block at a time."""
+
+    def __init__(self, fp: IO[str], styles: Optional[Styles] = None):
+        """
+        Create Writer instance.
+
+        Args:
+            fp: text stream
+            styles: document styles for heading levels
+        """
+        self.fp = fp
+        self.styles = Styles(xml_element=None) if styles is None else styles
+
+    def write(self, blocks: Iterable, title: Optional[str] = None):
+        """
+        Write document.
+
+        Args:
+            blocks: body blocks (paragraphs and tables), may be a stream
+            title: document title
+        """
+        self.start(title=title)
+        for block in blocks:
+            self.block(block=block)
+        self.end()
+
+    def block(self, block):
+        if block.tag == PARAGRAPH_TAG:
+            text = self.inline(runs=block._nodes) if block._nodes else ''
+            if not text.strip():
+                return
+            level = heading_level(paragraph=block, styles=self.styles)
+            if level is not None:
+                self.heading(text=text, level=min(level + 1, MAX_HEADING))
+            else:
+                self.paragraph(text=text, bullet=block.bullet)
+        elif block.tag == TABLE_TAG:
+            self.table(table=block)
+
+    def inline(self, runs) -> str:
+        """
+        Format runs, adjacent runs with equal formatting are joined.
+
+        Emphasis is nested bold, italic, underline from the outside, an
+        emphasis kept by the next runs stays open and whitespace is moved
+        outside of emphasis.
+        """
+        parts = []
+        opened = []
+        space = ''
+        for style, group in groupby(
+            runs, key=lambda run: tuple(getattr(run, name) for name in EMPHASIS),
+        ):
+            text = ''.join(run.text for run in group)
+            stripped = text.strip()
+            if not stripped:
+                space += text
+                continue
+            wanted = [name for name, value in zip(EMPHASIS, style) if value]
+            keep = 0
+            while keep < min(len(opened), len(wanted)) and opened[keep][0] == wanted[keep]:
+                keep += 1
+            markup = ''.join(close for _, close in reversed(opened[keep:]))
+            del opened[keep:]
+            space += text[:len(text) - len(text.lstrip())]
+            if space:
+                parts.append(markup + self.escape(text=space))
+                markup = ''
+            for name in wanted[keep:]:
+                start, end = self.emphasis(name=name, previous=markup)
+                markup += start
+                opened.append((name, end))
+            parts.append(markup)
+            parts.append(self.escape(text=stripped))
+            space = text[len(text.rstrip()):]
+        parts.extend(close for _, close in reversed(opened))
+        parts.append(self.escape(text=space))
+        return ''.join(parts)
+
+    def start(self, title: Optional[str]):
+        """Write document head."""
+
+    def end(self):
+        """Write document tail."""
+
+    @abstractmethod
+    def escape(self, text: str) -> str:
+        """Escape text."""
+
+    @abstractmethod
+    def emphasis(self, name: str, previous: str) -> tuple[str, str]:
+        """
+        Get opening and closing markup of an emphasis.
+
+        Args:
+            name: bold, italic or underline
+            previous: markup written right before the emphasis, empty
+                after text
+        """
+
+    @abstractmethod
+    def heading(self, text: str, level: int):
+        """Write heading."""
+
+    @abstractmethod
+    def paragraph(self, text: str, bullet: bool):
+        """Write paragraph or list item."""
+
+    @abstractmethod
+    def table(self, table):
+        """Write table."""
+
+
+class MarkdownWriter(Writer):
+    """GitHub flavored Markdown writer."""
+
+    def __init__(self, fp: IO[str], styles: Optional[Styles] = None):
+        super().__init__(fp=fp, styles=styles)
+        self._bullets = False
+
+    def escape(self, text: str) -> str:
+        return MARKDOWN_SPECIAL.sub(r'\\\1', text).replace('\n', '  \n')
+
+    def emphasis(self, name: str, previous: str) -> tuple[str, str]:
+        """Get emphasis markup, `_` delimiters follow a `*` delimiter."""
+
+        if name == 'underline':
+            return '<u>', '</u>'
+        delimiter = ('_' if previous.endswith('*') else '*') * (2 if name == 'bold' else 1)
+        return delimiter, delimiter
+
+    def heading(self, text: str, level: int):
+        self._end_list()
+        self.fp.write(f'{"#" * level} {text}\n\n')
+
+    def paragraph(self, text: str, bullet: bool):
+        if bullet:
+            self._bullets = True
+            self.fp.write(f'- {text}\n')
+            return
+        self._end_list()
+        self.fp.write(MARKDOWN_BLOCK_START.sub(r'\\\1', text) + '\n\n')
+
+    def table(self, table):
+        """Write table grid, merged cells are left empty after the first."""
+
+        self._end_list()
+        rows = [
+            [
+                '' if cell is None else self._cell_text(cell=cell)
+                for cell in _grid_row(row=row)
+            ]
+            for row in table._nodes
+        ]
+        if not rows:
+            return
+        width = max(len(row) for row in rows)
+        for row_idx, row in enumerate(rows):
+            row = row + [''] * (width - len(row))
+            self.fp.write('| {cells} |\n'.format(cells=' | '.join(row)))
+            if row_idx == 0:
+                self.fp.write('|{cells}|\n'.format(cells='|'.join(['---'] * width)))
+        self.fp.write('\n')
+
+    def end(self):
+        self._end_list()
+
+    def _cell_text(self, cell) -> str:
+        """Get cell text, nested tables are flattened to their cell texts."""
+
+        texts = []
+        for part in cell._nodes:
+            if part.tag == PARAGRAPH_TAG:
+                texts.append(self.inline(runs=part._nodes))
+            elif part.tag == TABLE_TAG:
+                nested = (
+                    self._cell_text(cell=nested)
+                    for row in part._nodes
+                    for nested in _grid_row(row=row)
+                    if nested is not None
+                )
+                texts.extend(text for text in nested if text)
+        return '<br>'.join(texts).replace('  \n', '<br>')
+
+    def _end_list(self):
+        if self._bullets:
+            self.fp.write('\n')
+            self._bullets = False
+
+
+class HtmlWriter(Writer):
+    """HTML writer."""
+
+    def __init__(self, fp: IO[str], styles: Optional[Styles] = None):
+        super().__init__(fp=fp, styles=styles)
+        self._bullets = False
+
+    def start(self, title: Optional[str]):
+        self.fp.write(
+            '<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n'
+            f'<title>{escape(title or "")}</title>\n</head>\n<body>\n',
+        )
+
+    def end(self):
+        self._end_list()
+        self.fp.write('</body>\n</html>\n')
+
+    def escape(self, text: str) -> str:
+        return escape(text, quote=False).replace('\n', '<br>')
+
+    def emphasis(self, name: str, previous: str) -> tuple[str, str]:
+        tag = HTML_EMPHASIS[name]
+        return f'<{tag}>', f'</{tag}>'
+
+    def heading(self, text: str, level: int):
+        self._end_list()
+        self.fp.write(f'<h{level}>{text}</h{level}>\n')
+
+    def paragraph(self, text: str, bullet: bool):
+        if bullet:
+            if not self._bullets:
+                self.fp.write('<ul>\n')
+                self._bullets = True
+            self.fp.write(f'<li>{text}</li>\n')
+            return
+        self._end_list()
+        self.fp.write(f'<p>{text}</p>\n')
+
+    def table(self, table):
+        """Write table, merged cells get colspan and rowspan."""
+
+        self._end_list()
+        self.fp.write('<table>\n')
+        rows = table._nodes
+        spans = _row_spans(rows=rows)
+        for row_idx, row in enumerate(rows):
+            self.fp.write('<tr>')
+            column = 0
+            for cell in row._nodes:
+                h_merge, v_merge = _cell_merge(cell=cell)
+                if not (v_merge['merged'] and not v_merge['first']):
+                    attributes = ''
+                    if h_merge > 1:
+                        attributes += f' colspan="{h_merge}"'
+                    rowspan = spans.get((row_idx, column), 1)
+                    if rowspan > 1:
+                        attributes += f' rowspan="{rowspan}"'
+                    self.fp.write(f'<td{attributes}>')
+                    for part in cell._nodes:
+                        self.block(block=part)
+                    self._end_list()
+                    self.fp.write('</td>')
+                column += h_merge
+            self.fp.write('</tr>\n')
+        self.fp.write('</table>\n')
+
+    def _end_list(self):
+        if self._bullets:
+            self.fp.write('</ul>\n')
+            self._bullets = False
+
+
+def _cell_merge(cell) -> tuple[int, dict]:
+    properties = cell.properties
+    return properties['h_merge'], properties['v_merge']
+
+
+def _grid_row(row) -> list:
+    """Get row cells by grid column, None for merged positions."""
+
+    cells = []
+    for cell in row._nodes:
+        h_merge, v_merge = _cell_merge(cell=cell)
+        first = not v_merge['merged'] or v_merge['first']
+        cells.append(cell if first else None)
+        cells.extend([None] * (h_merge - 1))
+    return cells
+
+
+def _row_spans(rows: list) -> dict:
+    """Get rowspan of vertically merged cells by (row, grid column)."""
+
+    spans = {}
+    open_spans = {}
+    for row_idx, row in enumerate(rows):
+        column = 0
+        for cell in row._nodes:
+            h_merge, v_merge = _cell_merge(cell=cell)
+            if v_merge['merged'] and not v_merge['first']:
+                start = open_spans.get(column)
+                if start is not None:
+                    spans[start] += 1
+            elif v_merge['merged']:
+                open_spans[column] = (row_idx, column)
+                spans[(row_idx, column)] = 1
+            else:
+                open_spans.pop(column, None)
+            column += h_merge
+    return spans
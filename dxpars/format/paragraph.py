@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import Optional
 
 from lxml.etree import ElementBase
@@ -65,3 +66,41 @@ class RunFormat(FormatElement):
             xml_element: mxl with formatting
         """
         super().__init__(xml_element=xml_element)
+
+    @cached_property
+    def bold(self) -> bool:
+        """Get Bold."""
+
+        return self.has_property(tag='b')
+
+    @cached_property
+    def italic(self) -> bool:
+        """Get Italic."""
+
+        return self.has_property(tag='i')
+
+    @cached_property
+    def underline(self) -> bool:
+        """Get Underline."""
+
+        return self.properties.get('u') is not None
+
+    @cached_property
+    def caps(self) -> bool:
+        """Get Caps."""
+
+        return self.properties.get('caps') is not None
+
+    def has_property(self, tag: str) -> bool:
+        """
+        Check toggle property is on.
+
+        Args:
+            tag: property tag
+        """
+        prop = self.properties.get(tag)
+        if prop is None:
+            return False
+        if not prop:
+            return True
+        return prop['val'].isdigit() and int(prop['val']) > 0
@@ -62,9 +62,7 @@ class CellFormat(FormatElement):
     @property
     def v_merge(self) -> dict:
         """Get vertical merging data."""
-        merged, first = False, False
-        if self._xml is not None:
-            v_merge = self._xml.find(path=self._make_tag(tag='vMerge'))
-            merged = v_merge is not None
-            first = merged and 'restart' in v_merge.attrib.values()
+        v_merge = self.properties.get('vMerge')
+        merged = v_merge is not None
+        first = merged and 'restart' in v_merge.values()
         return {'merged': merged, 'first': first}
\ No newline at end of file
@@ -0,0 +1,197 @@
+"""Columnar run and paragraph properties."""
+
+from array import array
+from typing import Iterator, Optional
+
+from dxpars.docx_objects.paragraph import Paragraph
+from dxpars.docx_objects.table import Table
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+RUN_COLUMNS = {
+    'block': 'q',
+    'paragraph': 'q',
+    'bold': 'B',
+    'italic': 'B',
+    'underline': 'B',
+    'caps': 'B',
+    'length': 'q',
+}
+PARAGRAPH_COLUMNS = {
+    'block': 'q',
+    'style': 'q',
+    'alignment': 'q',
+    'bold': 'B',
+    'italic': 'B',
+    'underline': 'B',
+    'caps': 'B',
+    'bullet': 'B',
+    'length': 'q',
+}
+NUMPY_TYPES = {'B': 'bool', 'q': 'int64'}
+
+
+class Frame(object):
+    """
+    Column arrays of object properties.
+
+    Columns are read-only NumPy arrays when NumPy is installed and
+    `array.array` otherwise. Categorical columns hold codes into
+    `categories` lists, -1 stands for None.
+    """
+
+    def __init__(self, columns: dict, categories: dict, objects: list):
+        """
+        Create Frame instance.
+
+        Args:
+            columns: column arrays by name
+            categories: category values by column name
+            objects: objects of frame rows
+        """
+        self.columns = columns
+        self.categories = categories
+        self.objects = objects
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    def __getitem__(self, column: str):
+        return self.columns[column]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def code(self, column: str, value: Optional[str]) -> int:
+        """
+        Get category code of a value.
+
+        Args:
+            column: categorical column name
+            value: category value
+
+        Returns:
+            Category code, -2 for unknown values.
+        """
+        if value is None:
+            return -1
+        categories = self.categories[column]
+        return categories.index(value) if value in categories else -2
+
+    def select(self, mask) -> list:
+        """
+        Get objects of rows selected by a boolean mask.
+
+        Args:
+            mask: boolean values for each row
+        """
+        return [obj for obj, selected in zip(self.objects, mask) if selected]
+
+
+class FrameBuilder(object):
+    """Single pass builder of run and paragraph frames."""
+
+    def __init__(self, blocks: list):
+        """
+        Create FrameBuilder instance.
+
+        Args:
+            blocks: top-level body blocks (paragraphs and tables)
+        """
+        self._runs = {column: array(code) for column, code in RUN_COLUMNS.items()}
+        self._paragraphs = {
+            column: array(code) for column, code in PARAGRAPH_COLUMNS.items()
+        }
+        self._categories = {'style': {}, 'alignment': {}}
+        self._run_objects = []
+        self._paragraph_objects = []
+        for block_idx, block in enumerate(blocks):
+            self._add_part(part=block, block=block_idx)
+
+    @property
+    def runs(self) -> Frame:
+        """Get runs frame."""
+
+        return Frame(
+            columns=self._columns(arrays=self._runs),
+            categories={},
+            objects=self._run_objects,
+        )
+
+    @property
+    def paragraphs(self) -> Frame:
+        """Get paragraphs frame."""
+
+        return Frame(
+            columns=self._columns(arrays=self._paragraphs),
+            categories={
+                column: list(values) for column, values in self._categories.items()
+            },
+            objects=self._paragraph_objects,
+        )
+
+    def _columns(self, arrays: dict) -> dict:
+        if numpy is None:
+            return {
+                column: array(values.typecode, values)
+                for column, values in arrays.items()
+            }
+        columns = {}
+        for column, values in arrays.items():
+            # views share the cached builder buffers, writes would leak into
+            # every frame of the document
+            view = numpy.frombuffer(values, dtype=NUMPY_TYPES[values.typecode])
+            view.flags.writeable = False
+            columns[column] = view
+        return columns
+
+    def _code(self, column: str, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        codes = self._categories[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        return code
+
+    def _add_part(self, part, block: int):
+        if part.tag == Paragraph.tag:
+            self._add_paragraph(paragraph=part, block=block)
+        elif part.tag == Table.tag:
+            for row in part._nodes:
+                for cell in row._nodes:
+                    for node in cell._nodes:
+                        self._add_part(part=node, block=block)
+
+    def _add_paragraph(self, paragraph, block: int):
+        paragraph_idx = len(self._paragraph_objects)
+        runs = self._runs
+        texts = []
+        for run in paragraph._nodes:
+            text = run.text
+            texts.append(text)
+            runs['block'].append(block)
+            runs['paragraph'].append(paragraph_idx)
+            runs['bold'].append(run.bold)
+            runs['italic'].append(run.italic)
+            runs['underline'].append(run.underline)
+            runs['caps'].append(run.caps)
+            runs['length'].append(len(text))
+            self._run_objects.append(run)
+        text = ''.join(texts)
+        paragraphs = self._paragraphs
+        paragraphs['block'].append(block)
+        paragraphs['style'].append(self._code(column='style', value=paragraph.pstyle))
+        paragraphs['alignment'].append(
+            self._code(column='alignment', value=paragraph.alignment),
+        )
+        paragraphs['bold'].append(paragraph._bold(texts=texts))
+        paragraphs['italic'].append(paragraph.italic)
+        paragraphs['underline'].append(paragraph.underline)
+        paragraphs['caps'].append(paragraph._caps(text=text))
+        paragraphs['bullet'].append(paragraph.bullet)
+        paragraphs['length'].append(len(text))
+        self._paragraph_objects.append(paragraph)
@@ -0,0 +1,178 @@
+"""Document full-text index."""
+
+import re
+from bisect import bisect_right
+from typing import Iterator, Optional, Pattern, Union
+
+from dxpars.docx_objects.paragraph import Paragraph, Run
+from dxpars.docx_objects.table import Cell, Table
+
+TOKEN = re.compile(r'\w+')
+
+
+class Match(object):
+    """Text match inside a paragraph."""
+
+    __slots__ = ('block', 'paragraph', 'cell', 'run', 'run_offset', 'start', 'end')
+
+    def __init__(
+        self,
+        block: int,
+        paragraph: Paragraph,
+        cell: Optional[Cell],
+        run: Optional[Run],
+        run_offset: int,
+        start: int,
+        end: int,
+    ):
+        """
+        Create Match instance.
+
+        Args:
+            block: index of the top-level body block
+            paragraph: matched paragraph
+            cell: innermost table cell containing the paragraph
+            run: run containing the match start
+            run_offset: match start offset inside the run
+            start: match start offset inside the paragraph text
+            end: match end offset inside the paragraph text
+        """
+        self.block = block
+        self.paragraph = paragraph
+        self.cell = cell
+        self.run = run
+        self.run_offset = run_offset
+        self.start = start
+        self.end = end
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({self.text!r}, {self.start}:{self.end})'
+
+    __repr__ = __str__
+
+    @property
+    def text(self) -> str:
+        """Get matched text."""
+
+        return self.paragraph.text[self.start:self.end]
+
+
+class TextIndex(object):
+    """Inverted index of document terms."""
+
+    def __init__(self, blocks: list):
+        """
+        Create TextIndex instance.
+
+        Args:
+            blocks: top-level body blocks (paragraphs and tables)
+        """
+        self._entries = []
+        self._texts = []
+        self._run_starts = []
+        self._postings = {}
+        for block_idx, block in enumerate(blocks):
+            for paragraph, cell in self._iter_paragraphs(part=block, cell=None):
+                self._add(block=block_idx, paragraph=paragraph, cell=cell)
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    @property
+    def terms(self):
+        """Get indexed terms."""
+
+        return self._postings.keys()
+
+    def find(self, term_or_regex: Union[str, Pattern]) -> list[Match]:
+        """
+        Find term, phrase or regular expression matches.
+
+        Args:
+            term_or_regex: term or phrase (case-insensitive) or compiled regex
+        """
+        if isinstance(term_or_regex, str):
+            tokens = [token.lower() for token in TOKEN.findall(term_or_regex)]
+            if not tokens:
+                return []
+            if len(tokens) == 1 and TOKEN.fullmatch(term_or_regex):
+                return [
+                    self._match(entry_id=entry_id, start=start, end=end)
+                    for entry_id, start, end in self._postings.get(tokens[0], ())
+                ]
+            return self._search(
+                pattern=re.compile(
+                    rf'(?<!\w){re.escape(term_or_regex)}(?!\w)', re.IGNORECASE,
+                ),
+                entry_ids=self._candidates(tokens=tokens),
+            )
+        return self._search(pattern=term_or_regex, entry_ids=range(len(self._entries)))
+
+    def _add(self, block: int, paragraph: Paragraph, cell: Optional[Cell]):
+        entry_id = len(self._entries)
+        run_starts = []
+        texts = []
+        offset = 0
+        for run in paragraph._nodes:
+            run_text = run.text
+            run_starts.append(offset)
+            texts.append(run_text)
+            offset += len(run_text)
+        text = ''.join(texts)
+        self._entries.append((block, paragraph, cell))
+        self._texts.append(text)
+        self._run_starts.append(run_starts)
+        postings = self._postings
+        # lowercasing may change text length, so offsets come from the original text
+        for token in TOKEN.finditer(text):
+            key = token.group().lower()
+            positions = postings.get(key)
+            if positions is None:
+                positions = postings[key] = []
+            positions.append((entry_id, token.start(), token.end()))
+
+    def _candidates(self, tokens: list[str]) -> list[int]:
+        entry_ids = None
+        for token in tokens:
+            token_entries = {
+                entry_id for entry_id, _, _ in self._postings.get(token, ())
+            }
+            entry_ids = token_entries if entry_ids is None else entry_ids & token_entries
+            if not entry_ids:
+                return []
+        return sorted(entry_ids)
+
+    def _search(self, pattern: Pattern, entry_ids) -> list[Match]:
+        texts = self._texts
+        return [
+            self._match(entry_id=entry_id, start=found.start(), end=found.end())
+            for entry_id in entry_ids
+            for found in pattern.finditer(texts[entry_id])
+        ]
+
+    def _match(self, entry_id: int, start: int, end: int) -> Match:
+        block, paragraph, cell = self._entries[entry_id]
+        run_starts = self._run_starts[entry_id]
+        run, run_offset = None, start
+        run_idx = bisect_right(run_starts, start) - 1
+        if run_idx >= 0:
+            run = paragraph._nodes[run_idx]
+            run_offset = start - run_starts[run_idx]
+        return Match(
+            block=block,
+            paragraph=paragraph,
+            cell=cell,
+            run=run,
+            run_offset=run_offset,
+            start=start,
+            end=end,
+        )
+
+    def _iter_paragraphs(self, part, cell: Optional[Cell]) -> Iterator[tuple]:
+        if part.tag == Paragraph.tag:
+            yield part, cell
+        elif part.tag == Table.tag:
+            for row in part._nodes:
+                for row_cell in row._nodes:
+                    for node in row_cell._nodes:
+                        yield from self._iter_paragraphs(part=node, cell=row_cell)
@@ -0,0 +1,174 @@
+"""Images and embedded objects of the docx package."""
+
+import shutil
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+from dxpars.package import Package
+from dxpars.relationships import Relationships
+
+MEDIA_FOLDERS = ('word/media/', 'word/embeddings/')
+MEDIA_TYPES = frozenset(['image', 'oleObject', 'package', 'audio', 'video', 'media'])
+COPY_SIZE = 1 << 20
+
+
+class MediaItem(object):
+    """Media part of the package."""
+
+    __slots__ = ('name', 'rids', 'type', 'size', 'content_type')
+
+    def __init__(
+        self,
+        name: str,
+        type: Optional[str],
+        size: int,
+        content_type: Optional[str] = None,
+    ):
+        """
+        Create MediaItem instance.
+
+        Args:
+            name: archive member name
+            type: relationship type (image, oleObject, package etc.),
+                None if the part is not referenced by the document
+            size: uncompressed size in bytes
+            content_type: content type of the part
+        """
+        self.name = name
+        self.rids = []
+        self.type = type
+        self.size = size
+        self.content_type = content_type
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({self.name}, {self.size} bytes)'
+
+    __repr__ = __str__
+
+    @property
+    def filename(self) -> str:
+        """Get file name of the part."""
+
+        return self.name.rsplit('/', 1)[-1]
+
+    @property
+    def to_dict(self) -> dict:
+        """Get dictionary representation of the item."""
+
+        return {
+            'name': self.name,
+            'rids': list(self.rids),
+            'type': self.type,
+            'size': self.size,
+            'content_type': self.content_type,
+        }
+
+
+class Media(object):
+    """
+    Media parts of an open docx package.
+
+    Parts are listed from `word/media`, `word/embeddings` and document
+    relationships. Streams are read from the archive of the document, so
+    they are valid until the document is closed.
+    """
+
+    def __init__(self, package: Optional[Package], rels: Relationships):
+        """
+        Create Media instance.
+
+        Args:
+            package: open docx package, None for documents without a package
+            rels: document relationships
+        """
+        self._package = package
+        self._items = {}
+        self._rids = {}
+        if package is None:
+            return
+        for rid in rels:
+            name = rels.part_name(rid=rid)
+            rel_type = rels.get(rid=rid)['type']
+            if name is None or name not in package.members:
+                continue
+            if rel_type not in MEDIA_TYPES and not name.startswith(MEDIA_FOLDERS):
+                continue
+            item = self._items.get(name)
+            if item is None:
+                item = self._items[name] = self._make_item(name=name, type=rel_type)
+            item.rids.append(rid)
+            self._rids[rid] = item
+        for name in package.members:
+            if name.startswith(MEDIA_FOLDERS) and name not in self._items:
+                self._items[name] = self._make_item(name=name, type=None)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[MediaItem]:
+        return iter(self._items.values())
+
+    def __contains__(self, name_or_rid: str) -> bool:
+        return self.get(name_or_rid=name_or_rid) is not None
+
+    def get(self, name_or_rid: Optional[str]) -> Optional[MediaItem]:
+        """
+        Get media item.
+
+        Args:
+            name_or_rid: archive member name or relationship id
+        """
+        item = self._items.get(name_or_rid)
+        return self._rids.get(name_or_rid) if item is None else item
+
+    def open(self, item: Union[MediaItem, str]) -> IO[bytes]:
+        """
+        Open media stream from the document archive.
+
+        Args:
+            item: media item, archive member name or relationship id
+
+        Returns:
+            Binary file-like object, read in chunks to keep memory bounded.
+
+        Raises:
+            KeyError: if the item is not a media part of the document
+        """
+        if not isinstance(item, MediaItem):
+            name = item
+            item = self.get(name_or_rid=name)
+            if item is None:
+                raise KeyError(f'No media part: {name}')
+        return self._package.open(name=item.name)
+
+    def extract(self, folder: Union[str, Path]) -> list[Path]:
+        """
+        Copy media files to a folder, one stream at a time.
+
+        Args:
+            folder: destination folder, created if missing
+
+        Returns:
+            Paths of written files, relative member names kept.
+
+        Raises:
+            ValueError: if a member name points outside the folder
+        """
+        folder = Path(folder)
+        folder.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for item in self:
+            if '..' in item.name.split('/'):
+                raise ValueError(f'Unsafe media part name: {item.name}')
+            path = folder / item.name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with self.open(item=item) as source, open(path, 'wb') as target:
+                shutil.copyfileobj(source, target, COPY_SIZE)
+            paths.append(path)
+        return paths
+
+    def _make_item(self, name: str, type: Optional[str]) -> MediaItem:
+        member = self._package.members[name]
+        return MediaItem(
+            name=name, type=type, size=member.size, content_type=member.content_type,
+        )
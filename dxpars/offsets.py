@@ -0,0 +1,158 @@
+"""Mapping of document text offsets to document objects."""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+from dxpars.docx_objects.paragraph import Paragraph, Run
+from dxpars.docx_objects.table import Cell, Table
+
+
+class Location(object):
+    """Document object at a text offset."""
+
+    __slots__ = ('paragraph', 'run', 'cell', 'start', 'offset')
+
+    def __init__(
+        self,
+        paragraph: Paragraph,
+        run: Optional[Run],
+        cell: Optional[Cell],
+        start: int,
+        offset: int,
+    ):
+        """
+        Create Location instance.
+
+        Args:
+            paragraph: paragraph at the offset
+            run: run at the offset
+            cell: innermost table cell containing the paragraph
+            start: run start offset in the document text
+            offset: offset inside the run
+        """
+        self.paragraph = paragraph
+        self.run = run
+        self.cell = cell
+        self.start = start
+        self.offset = offset
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({self.paragraph}, {self.run}, {self.offset})'
+
+    __repr__ = __str__
+
+
+class OffsetMap(object):
+    """Document text with run start offsets."""
+
+    def __init__(self, blocks: list):
+        """
+        Create OffsetMap instance. Text matches Document.text.
+
+        Args:
+            blocks: top-level body blocks (paragraphs and tables)
+        """
+        self.paragraphs = []
+        self.cells = []
+        self._starts = array('q')
+        self._ends = array('q')
+        self._paragraph_ids = array('l')
+        self._cell_ids = array('l')
+        self._runs = []
+        self._chunks = []
+        self._offset = 0
+        for idx, block in enumerate(blocks):
+            if idx:
+                self._write(text='\n')
+            self._add_part(part=block, cell_id=-1)
+        self.text = ''.join(self._chunks)
+        del self._chunks
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def locate(self, offset: int) -> Optional[Location]:
+        """
+        Get run at a text offset.
+
+        Args:
+            offset: document text offset
+
+        Returns:
+            Location, None if the offset is a separator or cell padding.
+        """
+        idx = bisect_right(self._starts, offset) - 1
+        if idx < 0 or offset >= self._ends[idx]:
+            return None
+        return self._location(idx=idx, offset=offset)
+
+    def span(self, start: int, end: int) -> list[Location]:
+        """
+        Get runs overlapping a text span.
+
+        Args:
+            start: span start offset
+            end: span end offset
+        """
+        first = max(bisect_right(self._starts, start) - 1, 0)
+        last = bisect_left(self._starts, end)
+        return [
+            self._location(idx=idx, offset=max(start, self._starts[idx]))
+            for idx in range(first, last)
+            if self._ends[idx] > start and self._ends[idx] > self._starts[idx]
+        ]
+
+    def _location(self, idx: int, offset: int) -> Location:
+        cell_id = self._cell_ids[idx]
+        return Location(
+            paragraph=self.paragraphs[self._paragraph_ids[idx]],
+            run=self._runs[idx],
+            cell=None if cell_id < 0 else self.cells[cell_id],
+            start=self._starts[idx],
+            offset=offset - self._starts[idx],
+        )
+
+    def _write(self, text: str):
+        self._chunks.append(text)
+        self._offset += len(text)
+
+    def _add_entry(self, run: Optional[Run], length: int, cell_id: int):
+        self._starts.append(self._offset)
+        self._ends.append(self._offset + length)
+        self._paragraph_ids.append(len(self.paragraphs) - 1)
+        self._cell_ids.append(cell_id)
+        self._runs.append(run)
+
+    def _add_part(self, part, cell_id: int):
+        if part.tag == Paragraph.tag:
+            self._add_paragraph(paragraph=part, cell_id=cell_id)
+        elif part.tag == Table.tag:
+            self._add_table(table=part)
+
+    def _add_paragraph(self, paragraph: Paragraph, cell_id: int):
+        self.paragraphs.append(paragraph)
+        if not paragraph._nodes:
+            self._add_entry(run=None, length=0, cell_id=cell_id)
+        for run in paragraph._nodes:
+            text = run.text
+            self._add_entry(run=run, length=len(text), cell_id=cell_id)
+            self._write(text=text)
+
+    def _add_table(self, table: Table):
+        for row_idx, row in enumerate(table._nodes):
+            if row_idx:
+                self._write(text='\n')
+            for cell_idx, cell in enumerate(row.expand.values()):
+                if cell_idx:
+                    self._write(text='\t')
+                cell_id = len(self.cells)
+                self.cells.append(cell)
+                cell_start = self._offset
+                for node_idx, node in enumerate(cell._nodes):
+                    if node_idx:
+                        self._write(text='\n')
+                    self._add_part(part=node, cell_id=cell_id)
+                padding = row.cell_width - (self._offset - cell_start)
+                if padding > 0:
+                    self._write(text=' ' * padding)
@@ -0,0 +1,222 @@
+"""Docx package (zip archive) access."""
+
+import posixpath
+from threading import Lock
+from typing import IO, Iterator, Optional, Union
+from zipfile import ZipFile
+
+from lxml.etree import ElementBase
+
+from dxpars.parser import DEFAULT_PROFILE, LimitedReader, ParseSession
+
+CONTENT_TYPES_PATH = '[Content_Types].xml'
+DOCUMENT_PATH = 'word/document.xml'
+RELS_PATH = 'word/_rels/document.xml.rels'
+STYLES_PATH = 'word/styles.xml'
+CONTENT_TYPES_NAMESPACE = (
+    '{http://schemas.openxmlformats.org/package/2006/content-types}'
+)
+
+
+class Member(object):
+    """Package member entry."""
+
+    __slots__ = ('name', 'size', 'compressed_size', 'offset', 'content_type')
+
+    def __init__(
+        self,
+        name: str,
+        size: int,
+        compressed_size: int,
+        offset: int,
+        content_type: Optional[str],
+    ):
+        """
+        Create Member instance.
+
+        Args:
+            name: member name
+            size: uncompressed size in bytes
+            compressed_size: compressed size in bytes
+            offset: local header offset in the archive
+            content_type: content type from [Content_Types].xml
+        """
+        self.name = name
+        self.size = size
+        self.compressed_size = compressed_size
+        self.offset = offset
+        self.content_type = content_type
+
+    def __str__(self) -> str:
+        return f'{self.__class__.__name__}({self.name}, {self.size} bytes)'
+
+    __repr__ = __str__
+
+
+class Package(object):
+    """
+    Open docx archive with a member index.
+
+    The central directory is read once, when the package is opened.
+    Content types are read on first use. Parsed xml members are cached,
+    so repeated access to a part does not read or parse it again.
+    """
+
+    def __init__(self, file_or_path: Union[str, IO]):
+        """
+        Open Package.
+
+        Args:
+            file_or_path: file or path to file
+        """
+        self._zipf = ZipFile(file_or_path)
+        self._members = None
+        self._xml = {}
+        self._lock = Lock()
+
+    def __enter__(self) -> 'Package':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._zipf.NameToInfo
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._zipf.NameToInfo)
+
+    def __len__(self) -> int:
+        return len(self._zipf.NameToInfo)
+
+    @property
+    def closed(self) -> bool:
+        """Check archive is closed."""
+
+        return self._zipf.fp is None
+
+    @property
+    def members(self) -> dict[str, Member]:
+        """Get member entries by name, directories excluded."""
+
+        if self._members is None:
+            with self._lock:
+                if self._members is None:
+                    self._members = self._index()
+        return self._members
+
+    def get(self, name: str) -> Optional[Member]:
+        """
+        Get member entry.
+
+        Args:
+            name: member name
+        """
+        return self.members.get(name)
+
+    def content_type(self, name: str) -> Optional[str]:
+        """
+        Get member content type.
+
+        Args:
+            name: member name
+        """
+        member = self.members.get(name)
+        return None if member is None else member.content_type
+
+    def read(self, name: str, session: Optional[ParseSession] = None) -> bytes:
+        """
+        Read member content.
+
+        Args:
+            name: member name
+            session: parser limits accounting
+
+        Raises:
+            KeyError: if the member is missing
+        """
+        if session is None:
+            session = DEFAULT_PROFILE.session()
+        return session.read(zipf=self._zipf, name=name)
+
+    def open(
+        self, name: str, session: Optional[ParseSession] = None,
+    ) -> Union[IO[bytes], LimitedReader]:
+        """
+        Open member stream.
+
+        Args:
+            name: member name
+            session: parser limits accounting, the stream is not limited
+                if not given
+
+        Raises:
+            KeyError: if the member is missing
+        """
+        if session is None:
+            return self._zipf.open(name)
+        return session.open(zipf=self._zipf, name=name)
+
+    def xml(self, name: str, session: Optional[ParseSession] = None) -> Optional[ElementBase]:
+        """
+        Get parsed xml member, parsed once per parser profile and cached.
+
+        A cached member still counts against the byte and time limits of
+        the session.
+
+        Args:
+            name: member name
+            session: parser limits accounting
+
+        Returns:
+            Member xml root, None if the member is missing.
+        """
+        if session is None:
+            session = DEFAULT_PROFILE.session()
+        key = (name, session.profile)
+        parsed = False
+        if key not in self._xml:
+            with self._lock:
+                if key not in self._xml:
+                    self._xml[key] = session.parse(
+                        content=self.read(name=name, session=session),
+                    ) if name in self else None
+                    parsed = True
+        if not parsed and name in self:
+            session.add_bytes(size=self._zipf.getinfo(name).file_size)
+        return self._xml[key]
+
+    def close(self):
+        """Close the archive and drop cached members."""
+
+        self._zipf.close()
+        self._xml.clear()
+
+    def _index(self) -> dict[str, Member]:
+        defaults, overrides = self._content_types()
+        members = {}
+        for info in self._zipf.infolist():
+            if info.is_dir():
+                continue
+            extension = posixpath.splitext(info.filename)[1][1:].lower()
+            members[info.filename] = Member(
+                name=info.filename,
+                size=info.file_size,
+                compressed_size=info.compress_size,
+                offset=info.header_offset,
+                content_type=overrides.get(
+                    f'/{info.filename}'.lower(), defaults.get(extension),
+                ),
+            )
+        return members
+
+    def _content_types(self) -> tuple[dict, dict]:
+        defaults, overrides = {}, {}
+        if CONTENT_TYPES_PATH not in self:
+            return defaults, overrides
+        root = DEFAULT_PROFILE.session().parse(content=self.read(name=CONTENT_TYPES_PATH))
+        for node in root.iterchildren(f'{CONTENT_TYPES_NAMESPACE}Default'):
+            defaults[(node.get('Extension') or '').lower()] = node.get('ContentType')
+        for node in root.iterchildren(f'{CONTENT_TYPES_NAMESPACE}Override'):
+            overrides[(node.get('PartName') or '').lower()] = node.get('ContentType')
+        return defaults, overrides
@@ -0,0 +1,182 @@
+"""Parallel parsing of a single document.
+
+The body of document.xml is split at top-level block boundaries into
+contiguous chunks. Worker processes parse the chunks into detached
+objects (see dxpars.data), which are joined in document order.
+"""
+
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import IO, Optional, Union
+
+from dxpars.base.base_objects import ParseContext
+from dxpars.data import BodyData, DocumentData
+from dxpars.docx_objects.body import Body
+from dxpars.package import DOCUMENT_PATH, RELS_PATH, STYLES_PATH, Package
+from dxpars.parser import DEFAULT_PROFILE, ParserProfile
+from dxpars.relationships import Relationships
+from dxpars.styles import Styles
+
+CHUNKS_PER_WORKER = 4
+
+BODY_START = re.compile(rb'<((?:[\w.-]+:)?)body(?:\s[^>]*)?>')
+BLOCK_START = re.compile(rb'<(!--|\?|!\[CDATA\[|[\w.:-]+)')
+SPECIAL_ENDS = {b'!--': b'-->', b'?': b'?>', b'![CDATA[': b']]>'}
+ATTRIBUTES = rb'(?:\s(?:"[^"]*"|\'[^\']*\'|[^\'">/])*)?'
+
+
+def parse(
+    file_or_path: Union[str, IO],
+    filename: Optional[str] = None,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    insertions: bool = True,
+    deletions: bool = False,
+    profile: Optional[ParserProfile] = None,
+) -> DocumentData:
+    """
+    Parse document body in worker processes.
+
+    Args:
+        file_or_path: file or path to file
+        filename: filename (for IO)
+        workers: number of worker processes, defaults to CPU count
+        executor: executor to run chunks on instead of a new process pool
+        insertions: include text of tracked insertions
+        deletions: include text of tracked deletions
+        profile: xml parser options and resource limits, element and
+            depth limits apply to each chunk
+    """
+    if filename is None:
+        filename = file_or_path if isinstance(file_or_path, str) else 'Document'
+    profile = DEFAULT_PROFILE if profile is None else profile
+    session = profile.session()
+    with Package(file_or_path) as package:
+        rels, styles = (
+            package.read(name=path, session=session) if path in package else None
+            for path in (RELS_PATH, STYLES_PATH)
+        )
+        content = package.read(name=DOCUMENT_PATH, session=session)
+    workers = workers or os.cpu_count() or 1
+    head, chunks, tail = split_body(content=content, chunks=workers * CHUNKS_PER_WORKER)
+    tasks = [
+        (head, chunk, tail, rels, styles, insertions, deletions, profile)
+        for chunk in chunks
+    ]
+    if executor is not None:
+        results = executor.map(parse_chunk, tasks)
+    elif workers == 1 or len(tasks) < 2:
+        results = map(parse_chunk, tasks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(parse_chunk, tasks))
+    nodes = []
+    for chunk_nodes in results:
+        nodes.extend(chunk_nodes)
+    return DocumentData(
+        filename=filename,
+        body=BodyData(properties=None, nodes=nodes),
+        styles=Styles.from_bytes(content=styles, session=session),
+    )
+
+
+def parse_chunk(task: tuple) -> list:
+    """
+    Parse body chunk into detached objects.
+
+    Args:
+        task: document head, body chunk, document tail, relationships
+            and styles content, insertions and deletions options, parser
+            profile
+    """
+    head, chunk, tail, rels, styles, insertions, deletions, profile = task
+    session = profile.session()
+    context = ParseContext(
+        rels=Relationships.from_bytes(content=rels, session=session),
+        styles=Styles.from_bytes(content=styles, session=session),
+        insertions=insertions,
+        deletions=deletions,
+    )
+    body = Body(
+        doc_tree=session.parse(content=head + chunk + tail), context=context,
+    )
+    return [node.detach() for node in body._nodes]
+
+
+def split_body(content: bytes, chunks: int) -> tuple[bytes, list[bytes], bytes]:
+    """
+    Split document.xml at top-level body children.
+
+    Args:
+        content: document.xml content
+        chunks: maximum number of chunks
+
+    Returns:
+        Document head up to the body content, body chunks and document tail.
+    """
+    body = BODY_START.search(content)
+    if body is None:
+        return content, [], b''
+    prefix = body.group(1)
+    body_end = content.rindex(b'</' + prefix + b'body>')
+    spans = list(block_spans(content=content, start=body.end(), end=body_end))
+    head = content[:body.end()]
+    tail = content[body_end:]
+    if not spans:
+        return head, [content[body.end():body_end]], tail
+
+    chunk_size = max((spans[-1][1] - spans[0][0]) // max(chunks, 1), 1)
+    result = []
+    chunk_start, chunk_end = spans[0][0], spans[0][0]
+    for start, end in spans:
+        if chunk_end - chunk_start >= chunk_size:
+            result.append(content[chunk_start:chunk_end])
+            chunk_start = start
+        chunk_end = end
+    result.append(content[chunk_start:chunk_end])
+    return head, result, tail
+
+
+def block_spans(content: bytes, start: int, end: int):
+    """
+    Find byte spans of top-level elements.
+
+    Args:
+        content: xml content
+        start: scan start offset
+        end: scan end offset
+    """
+    patterns = {}
+    pos = start
+    while True:
+        found = BLOCK_START.search(content, pos, end)
+        if found is None:
+            return
+        name = found.group(1)
+        special_end = SPECIAL_ENDS.get(name)
+        if special_end is not None:
+            pos = content.index(special_end, found.end()) + len(special_end)
+            continue
+        pattern = patterns.get(name)
+        if pattern is None:
+            pattern = patterns[name] = re.compile(
+                rb'<!--.*?-->|<(/?)' + re.escape(name) + ATTRIBUTES + rb'(/?)>',
+                re.DOTALL,
+            )
+        depth = 0
+        pos = found.start()
+        while True:
+            tag = pattern.search(content, pos, end)
+            if tag is None:
+                raise ValueError(f'Unclosed element {name.decode()} at {found.start()}')
+            pos = tag.end()
+            if tag.group(0).startswith(b'<!--'):
+                continue
+            if tag.group(1):
+                depth -= 1
+            elif not tag.group(2):
+                depth += 1
+            if depth == 0:
+                break
+        yield found.start(), pos
@@ -0,0 +1,276 @@
+"""XML parser profiles and resource limits."""
+
+import threading
+import time
+from typing import IO, Iterator, Optional
+from zipfile import ZipFile
+
+from lxml import etree
+from lxml.etree import ElementBase
+
+READ_SIZE = 1 << 20
+
+_local = threading.local()
+
+
+class LimitError(ValueError):
+    """Document exceeds a parser profile limit."""
+
+    def __init__(self, limit: str, value, maximum):
+        """
+        Create LimitError instance.
+
+        Args:
+            limit: limit name
+            value: reached value
+            maximum: limit value
+        """
+        super().__init__(f'{limit} limit exceeded: {value} > {maximum}')
+        self.limit = limit
+        self.value = value
+        self.maximum = maximum
+
+
+class ParserProfile(object):
+    """
+    XML parser options and resource limits.
+
+    lxml parsers are cached per thread and per options. Limits are checked
+    while package parts are read and parsed: `max_bytes` caps the total
+    uncompressed size read from the archive, `max_elements` and `max_depth`
+    cap each parsed part, `timeout` (seconds) caps reading and parsing of
+    the whole document.
+    """
+
+    def __init__(
+        self,
+        remove_blank_text: bool = False,
+        remove_comments: bool = False,
+        resolve_entities: bool = False,
+        huge_tree: bool = False,
+        max_bytes: Optional[int] = None,
+        max_elements: Optional[int] = None,
+        max_depth: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Create ParserProfile instance.
+
+        Args:
+            remove_blank_text: drop ignorable whitespace between tags
+            remove_comments: drop xml comments
+            resolve_entities: resolve internal DTD entities
+            huge_tree: disable libxml2 security limits on tree depth and text size
+            max_bytes: maximum uncompressed bytes read from the archive
+            max_elements: maximum number of elements in a part
+            max_depth: maximum element nesting depth
+            timeout: wall-clock budget in seconds
+        """
+        self.remove_blank_text = remove_blank_text
+        self.remove_comments = remove_comments
+        self.resolve_entities = resolve_entities
+        self.huge_tree = huge_tree
+        self.max_bytes = max_bytes
+        self.max_elements = max_elements
+        self.max_depth = max_depth
+        self.timeout = timeout
+
+    @property
+    def options(self) -> dict:
+        """Get lxml parser options."""
+
+        return {
+            'remove_blank_text': self.remove_blank_text,
+            'remove_comments': self.remove_comments,
+            'resolve_entities': self.resolve_entities,
+            'huge_tree': self.huge_tree,
+            'no_network': True,
+            'load_dtd': False,
+        }
+
+    @property
+    def parser(self) -> etree.XMLParser:
+        """Get parser of the current thread."""
+
+        parsers = getattr(_local, 'parsers', None)
+        if parsers is None:
+            parsers = _local.parsers = {}
+        key = tuple(sorted(self.options.items()))
+        parser = parsers.get(key)
+        if parser is None:
+            parser = parsers[key] = etree.XMLParser(**self.options)
+        return parser
+
+    @property
+    def has_tree_limits(self) -> bool:
+        """Check element, depth or time limits are set."""
+
+        return any(
+            limit is not None
+            for limit in (self.max_elements, self.max_depth, self.timeout)
+        )
+
+    def session(self) -> 'ParseSession':
+        """Start limits accounting for a document."""
+
+        return ParseSession(profile=self)
+
+
+class ParseSession(object):
+    """Limits accounting for one document."""
+
+    def __init__(self, profile: ParserProfile):
+        """
+        Create ParseSession instance.
+
+        Args:
+            profile: parser profile
+        """
+        self.profile = profile
+        self.bytes_read = 0
+        self.deadline = None
+        if profile.timeout is not None:
+            self.deadline = time.monotonic() + profile.timeout
+
+    def check_time(self):
+        """Raise LimitError if the wall-clock budget is spent."""
+
+        if self.deadline is None:
+            return
+        now = time.monotonic()
+        if now > self.deadline:
+            raise LimitError(
+                limit='timeout',
+                value=now - self.deadline + self.profile.timeout,
+                maximum=self.profile.timeout,
+            )
+
+    def add_bytes(self, size: int):
+        """
+        Count bytes read from the archive, raise LimitError over the limit.
+
+        Args:
+            size: number of uncompressed bytes
+        """
+        self.bytes_read += size
+        max_bytes = self.profile.max_bytes
+        if max_bytes is not None and self.bytes_read > max_bytes:
+            raise LimitError(limit='max_bytes', value=self.bytes_read, maximum=max_bytes)
+        self.check_time()
+
+    def read(self, zipf: ZipFile, name: str) -> bytes:
+        """
+        Read archive member within the size limit.
+
+        Args:
+            zipf: docx archive
+            name: member name
+        """
+        max_bytes = self.profile.max_bytes
+        if max_bytes is not None:
+            declared = self.bytes_read + zipf.getinfo(name).file_size
+            if declared > max_bytes:
+                raise LimitError(limit='max_bytes', value=declared, maximum=max_bytes)
+        with self.open(zipf=zipf, name=name) as member:
+            return b''.join(iter(lambda: member.read(READ_SIZE), b''))
+
+    def open(self, zipf: ZipFile, name: str) -> 'LimitedReader':
+        """
+        Open archive member stream within the size limit.
+
+        Args:
+            zipf: docx archive
+            name: member name
+        """
+        return LimitedReader(stream=zipf.open(name), session=self)
+
+    def parse(self, content: bytes) -> ElementBase:
+        """
+        Parse xml within the profile limits.
+
+        Args:
+            content: xml content
+        """
+        if not self.profile.has_tree_limits:
+            return etree.fromstring(content, parser=self.profile.parser)
+        parser = etree.XMLPullParser(events=('start', 'end'), **self.profile.options)
+        counter = self._counter()
+        for pos in range(0, len(content), READ_SIZE):
+            parser.feed(content[pos:pos + READ_SIZE])
+            for event, _ in parser.read_events():
+                counter.send(event)
+            self.check_time()
+        return parser.close()
+
+    def iterparse(self, source: IO, events=('start', 'end')) -> Iterator[tuple]:
+        """
+        Iterate over parse events within the profile limits.
+
+        Args:
+            source: xml stream
+            events: events to yield, start and end are always tracked
+        """
+        counter = self._counter()
+        tracked = tuple(set(events) | {'start', 'end'})
+        for count, (event, element) in enumerate(
+            etree.iterparse(source, events=tracked, **self.profile.options),
+        ):
+            counter.send(event)
+            if not count % 10000:
+                self.check_time()
+            if event in events:
+                yield event, element
+
+    def _counter(self):
+        counter = self._count_elements()
+        next(counter)
+        return counter
+
+    def _count_elements(self):
+        max_elements, max_depth = self.profile.max_elements, self.profile.max_depth
+        elements = depth = 0
+        while True:
+            event = yield
+            if event == 'start':
+                elements += 1
+                depth += 1
+                if max_elements is not None and elements > max_elements:
+                    raise LimitError(
+                        limit='max_elements', value=elements, maximum=max_elements,
+                    )
+                if max_depth is not None and depth > max_depth:
+                    raise LimitError(limit='max_depth', value=depth, maximum=max_depth)
+            elif event == 'end':
+                depth -= 1
+
+
+class LimitedReader(object):
+    """Archive member stream counting uncompressed bytes."""
+
+    def __init__(self, stream: IO, session: ParseSession):
+        """
+        Create LimitedReader instance.
+
+        Args:
+            stream: member stream
+            session: limits accounting
+        """
+        self._stream = stream
+        self._session = session
+
+    def __enter__(self) -> 'LimitedReader':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._session.add_bytes(size=len(data))
+        return data
+
+    def close(self):
+        self._stream.close()
+
+
+DEFAULT_PROFILE = ParserProfile()
@@ -0,0 +1,95 @@
+"""Docx package relationships."""
+
+import posixpath
+from typing import Optional
+
+from lxml.etree import ElementBase
+
+from dxpars.base.base_objects import XmlElement
+from dxpars.parser import DEFAULT_PROFILE, ParseSession
+
+
+class Relationships(XmlElement):
+    """Part relationships (word/_rels/document.xml.rels)."""
+
+    namespace = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+    tag = 'Relationship'
+    base = 'word'
+
+    def __init__(self, xml_element: Optional[ElementBase]):
+        """
+        Create Relationships instance.
+
+        Args:
+            xml_element: relationships xml tree
+        """
+        super().__init__(xml_element=xml_element)
+        self._rels = {}
+        if self._xml is not None:
+            for node in self._xml.iter(self._make_tag(tag=self.tag)):
+                self._rels[node.get('Id')] = {
+                    'target': node.get('Target'),
+                    'type': node.get('Type', '').rsplit('/', 1)[-1],
+                    'external': node.get('TargetMode') == 'External',
+                }
+
+    @classmethod
+    def from_bytes(
+        cls, content: Optional[bytes], session: Optional[ParseSession] = None,
+    ) -> 'Relationships':
+        """
+        Parse relationships part.
+
+        Args:
+            content: part content, None if the part is missing
+            session: parser limits accounting
+        """
+        if content is None:
+            return cls(xml_element=None)
+        if session is None:
+            session = DEFAULT_PROFILE.session()
+        return cls(xml_element=session.parse(content=content))
+
+    def __len__(self) -> int:
+        return len(self._rels)
+
+    def __iter__(self):
+        return iter(self._rels)
+
+    def get(self, rid: Optional[str]) -> Optional[dict]:
+        """
+        Get relationship data.
+
+        Args:
+            rid: relationship id
+        """
+        return self._rels.get(rid)
+
+    def target(self, rid: Optional[str]) -> Optional[str]:
+        """
+        Get relationship target.
+
+        Args:
+            rid: relationship id
+        """
+        rel = self._rels.get(rid)
+        return None if rel is None else rel['target']
+
+    def part_name(self, rid: Optional[str]) -> Optional[str]:
+        """
+        Get package part name of an internal relationship target.
+
+        Args:
+            rid: relationship id
+
+        Returns:
+            Archive member name (e.g. word/media/image1.png), None for
+            unknown and external relationships.
+        """
+        rel = self._rels.get(rid)
+        if rel is None or rel['external'] or not rel['target']:
+            return None
+        target = rel['target']
+        if target.startswith('/'):
+            return posixpath.normpath(target).lstrip('/')
+        return posixpath.normpath(posixpath.join(self.base, target))
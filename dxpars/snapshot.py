@@ -0,0 +1,291 @@
+"""Compact binary snapshots of parsed documents.
+
+Snapshot layout (all integers are unsigned LEB128 varints):
+
+    magic, version
+    strings:    count, (length, utf-8 bytes)*
+    properties: count, value*
+    filename:   string index
+    body:       node
+
+Node is a kind byte and properties index (0 for None) followed by
+the run text (length, utf-8 bytes) or by the child nodes (count, node*).
+Paragraph nodes have outline level + 1 (0 for None) and a section break
+byte before the child nodes.
+Property keys and string values are interned in the strings table and
+equal property dicts are stored once.
+"""
+
+from typing import IO, Any, Union
+
+from dxpars.data import (
+    BodyData,
+    CellData,
+    DocumentData,
+    ParagraphData,
+    RowData,
+    RunData,
+    TableData,
+    outline_level,
+)
+
+MAGIC = b'DXPS'
+VERSION = 2
+
+KINDS = (BodyData, ParagraphData, RunData, TableData, RowData, CellData)
+KIND_IDS = {kind.tag: kind_id for kind_id, kind in enumerate(KINDS)}
+RUN_KIND = KIND_IDS[RunData.tag]
+PARAGRAPH_KIND = KIND_IDS[ParagraphData.tag]
+
+NONE, FALSE, TRUE, INT, STR, TUPLE, LIST, DICT = range(8)
+
+
+class SnapshotError(ValueError):
+    """Invalid snapshot data."""
+
+
+def dump(document, file_or_path: Union[str, IO]):
+    """
+    Write document snapshot.
+
+    Args:
+        document: Document or DocumentData
+        file_or_path: binary file or path to file
+    """
+    content = dumps(document=document)
+    if isinstance(file_or_path, str):
+        with open(file_or_path, mode='wb') as file:
+            file.write(content)
+    else:
+        file_or_path.write(content)
+
+
+def dumps(document) -> bytes:
+    """
+    Get document snapshot bytes.
+
+    Args:
+        document: Document or DocumentData
+    """
+    return _Writer().write(document=document)
+
+
+def load(file_or_path: Union[str, IO]) -> DocumentData:
+    """
+    Read document snapshot.
+
+    Args:
+        file_or_path: binary file or path to file
+    """
+    if isinstance(file_or_path, str):
+        with open(file_or_path, mode='rb') as file:
+            return loads(content=file.read())
+    return loads(content=file_or_path.read())
+
+
+def loads(content: bytes) -> DocumentData:
+    """
+    Read document snapshot from bytes.
+
+    Args:
+        content: snapshot bytes
+    """
+    return _Reader(content=content).read()
+
+
+def _write_varint(buffer: bytearray, number: int):
+    while number > 0x7f:
+        buffer.append((number & 0x7f) | 0x80)
+        number >>= 7
+    buffer.append(number)
+
+
+class _Writer(object):
+    """Snapshot encoder."""
+
+    def __init__(self):
+        self._strings = {}
+        self._properties = {}
+
+    def write(self, document) -> bytes:
+        nodes = bytearray()
+        filename = self._string(value=document.filename)
+        self._write_node(buffer=nodes, part=document.body)
+
+        content = bytearray(MAGIC)
+        content.append(VERSION)
+        _write_varint(content, len(self._strings))
+        for string in self._strings:
+            encoded = string.encode('utf-8')
+            _write_varint(content, len(encoded))
+            content += encoded
+        _write_varint(content, len(self._properties))
+        for properties in self._properties:
+            content += properties
+        _write_varint(content, filename)
+        content += nodes
+        return bytes(content)
+
+    def _string(self, value: str) -> int:
+        string_id = self._strings.get(value)
+        if string_id is None:
+            string_id = self._strings[value] = len(self._strings)
+        return string_id
+
+    def _write_node(self, buffer: bytearray, part):
+        kind = KIND_IDS[part.tag]
+        buffer.append(kind)
+        properties = part.properties
+        if properties is None:
+            buffer.append(0)
+        else:
+            value = bytearray()
+            self._write_value(buffer=value, value=properties)
+            value = bytes(value)
+            properties_id = self._properties.get(value)
+            if properties_id is None:
+                properties_id = self._properties[value] = len(self._properties)
+            _write_varint(buffer, properties_id + 1)
+        if kind == RUN_KIND:
+            encoded = part.text.encode('utf-8')
+            _write_varint(buffer, len(encoded))
+            buffer += encoded
+        else:
+            if kind == PARAGRAPH_KIND:
+                level = outline_level(paragraph=part)
+                _write_varint(buffer, 0 if level is None else level + 1)
+                buffer.append(part.section_break)
+            _write_varint(buffer, len(part._nodes))
+            for node in part._nodes:
+                self._write_node(buffer=buffer, part=node)
+
+    def _write_value(self, buffer: bytearray, value: Any):
+        if value is None:
+            buffer.append(NONE)
+        elif value is True:
+            buffer.append(TRUE)
+        elif value is False:
+            buffer.append(FALSE)
+        elif isinstance(value, int):
+            buffer.append(INT)
+            _write_varint(buffer, (value << 1) ^ (value >> 63))
+        elif isinstance(value, str):
+            buffer.append(STR)
+            _write_varint(buffer, self._string(value=value))
+        elif isinstance(value, (tuple, list)):
+            buffer.append(TUPLE if isinstance(value, tuple) else LIST)
+            _write_varint(buffer, len(value))
+            for item in value:
+                self._write_value(buffer=buffer, value=item)
+        elif isinstance(value, dict):
+            buffer.append(DICT)
+            _write_varint(buffer, len(value))
+            for key, item in value.items():
+                _write_varint(buffer, self._string(value=key))
+                self._write_value(buffer=buffer, value=item)
+        else:
+            raise SnapshotError(f'Unsupported property value: {value!r}')
+
+
+class _Reader(object):
+    """Snapshot decoder."""
+
+    def __init__(self, content: bytes):
+        self._content = bytes(content)
+        self._pos = 0
+        self._strings = []
+        self._properties = []
+
+    def read(self) -> DocumentData:
+        content = self._content
+        if content[:len(MAGIC)] != MAGIC:
+            raise SnapshotError('Not a dxpars snapshot')
+        if len(content) == len(MAGIC):
+            raise SnapshotError('Truncated snapshot')
+        if content[len(MAGIC)] != VERSION:
+            raise SnapshotError(f'Unsupported snapshot version: {content[len(MAGIC)]}')
+        self._pos = len(MAGIC) + 1
+        try:
+            for _ in range(self._varint()):
+                self._strings.append(self._bytes(length=self._varint()).decode('utf-8'))
+            for _ in range(self._varint()):
+                self._properties.append(self._read_value())
+            filename = self._strings[self._varint()]
+            body = self._read_node()
+        except IndexError as error:
+            raise SnapshotError('Invalid snapshot reference') from error
+        except UnicodeDecodeError as error:
+            raise SnapshotError('Invalid snapshot string') from error
+        if self._pos != len(content):
+            raise SnapshotError(f'Unexpected data at {self._pos}')
+        return DocumentData(filename=filename, body=body)
+
+    def _byte(self) -> int:
+        if self._pos >= len(self._content):
+            raise SnapshotError('Truncated snapshot')
+        byte = self._content[self._pos]
+        self._pos += 1
+        return byte
+
+    def _bytes(self, length: int) -> bytes:
+        end = self._pos + length
+        if end > len(self._content):
+            raise SnapshotError('Truncated snapshot')
+        value = self._content[self._pos:end]
+        self._pos = end
+        return value
+
+    def _varint(self) -> int:
+        result = shift = 0
+        while True:
+            byte = self._byte()
+            result |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def _read_node(self):
+        kind_id = self._byte()
+        if kind_id >= len(KINDS):
+            raise SnapshotError(f'Unknown node kind: {kind_id}')
+        kind = KINDS[kind_id]
+        properties_id = self._varint()
+        properties = self._properties[properties_id - 1] if properties_id else None
+        if kind is RunData:
+            text = self._bytes(length=self._varint()).decode('utf-8')
+            return RunData(text=text, properties=properties)
+        if kind is ParagraphData:
+            level = self._varint()
+            section_break = bool(self._byte())
+            nodes = [self._read_node() for _ in range(self._varint())]
+            return ParagraphData(
+                properties=properties,
+                nodes=nodes,
+                outline_level=level - 1 if level else None,
+                section_break=section_break,
+            )
+        nodes = [self._read_node() for _ in range(self._varint())]
+        return kind(properties=properties, nodes=nodes)
+
+    def _read_value(self) -> Any:
+        value_type = self._byte()
+        if value_type == NONE:
+            return None
+        if value_type == TRUE:
+            return True
+        if value_type == FALSE:
+            return False
+        if value_type == INT:
+            number = self._varint()
+            return (number >> 1) ^ -(number & 1)
+        if value_type == STR:
+            return self._strings[self._varint()]
+        if value_type in (TUPLE, LIST):
+            items = [self._read_value() for _ in range(self._varint())]
+            return tuple(items) if value_type == TUPLE else items
+        if value_type == DICT:
+            return {
+                self._strings[self._varint()]: self._read_value()
+                for _ in range(self._varint())
+            }
+        raise SnapshotError(f'Unknown value type: {value_type}')
@@ -0,0 +1,353 @@
+"""Corpus statistics streamed from document xml.
+
+Statistics of each document are collected in one iterparse pass over
+document.xml without building document objects. Results are mergeable,
+so a corpus can be split between worker processes and the partial
+results summed.
+"""
+
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from dxpars.base.base_objects import XmlElement
+from dxpars.package import DOCUMENT_PATH, Package
+from dxpars.parser import DEFAULT_PROFILE, ParserProfile
+
+BATCH_SIZE = 64
+TOP_STYLES = 10
+
+_W = XmlElement.namespace
+PARAGRAPH = f'{_W}p'
+RUN = f'{_W}r'
+TABLE = f'{_W}tbl'
+ROW = f'{_W}tr'
+CELL = f'{_W}tc'
+TEXT = f'{_W}t'
+CHAR_TAGS = frozenset([f'{_W}tab', f'{_W}br', f'{_W}cr'])
+PSTYLE = f'{_W}pStyle'
+GRID_SPAN = f'{_W}gridSpan'
+V_MERGE = f'{_W}vMerge'
+VAL = f'{_W}val'
+BLOCKS = frozenset([PARAGRAPH, TABLE])
+COUNTED = {PARAGRAPH: 'paragraphs', RUN: 'runs', TABLE: 'tables', ROW: 'rows', CELL: 'cells'}
+DEFAULT_STYLE = '(default)'
+
+
+class Histogram(object):
+    """Power of two buckets of non-negative values."""
+
+    __slots__ = ('buckets', 'count', 'total', 'maximum')
+
+    def __init__(self):
+        """Create empty Histogram instance."""
+
+        self.buckets = []
+        self.count = 0
+        self.total = 0
+        self.maximum = 0
+
+    def add(self, value: int):
+        """
+        Add value.
+
+        Args:
+            value: non-negative integer
+        """
+        bucket = value.bit_length()
+        if bucket >= len(self.buckets):
+            self.buckets.extend([0] * (bucket + 1 - len(self.buckets)))
+        self.buckets[bucket] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: 'Histogram'):
+        """
+        Add values of another histogram.
+
+        Args:
+            other: histogram
+        """
+        if len(other.buckets) > len(self.buckets):
+            self.buckets.extend([0] * (len(other.buckets) - len(self.buckets)))
+        for bucket, count in enumerate(other.buckets):
+            self.buckets[bucket] += count
+        self.count += other.count
+        self.total += other.total
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> int:
+        """
+        Get upper bound of the bucket holding the quantile.
+
+        Args:
+            q: quantile from 0 to 1
+        """
+        rank = q * self.count
+        seen = 0
+        for bucket, count in enumerate(self.buckets):
+            seen += count
+            if count and seen >= rank:
+                return min((1 << bucket) - 1, self.maximum)
+        return self.maximum
+
+    @property
+    def to_dict(self) -> dict:
+        """Get dictionary representation of the histogram."""
+
+        return {
+            'count': self.count,
+            'mean': round(self.mean, 2),
+            'p50': self.quantile(q=0.5),
+            'p90': self.quantile(q=0.9),
+            'max': self.maximum,
+            'buckets': {
+                f'<{1 << bucket}': count
+                for bucket, count in enumerate(self.buckets) if count
+            },
+        }
+
+
+class Stats(object):
+    """Aggregated statistics of one or many documents."""
+
+    counters = ('documents', 'paragraphs', 'runs', 'tables', 'rows', 'cells')
+
+    def __init__(self):
+        """Create empty Stats instance."""
+
+        self.documents = 0
+        self.paragraphs = 0
+        self.runs = 0
+        self.tables = 0
+        self.rows = 0
+        self.cells = 0
+        self.merged_cells = Counter()
+        self.styles = Counter()
+        self.errors = Counter()
+        self.paragraph_length = Histogram()
+        self.document_length = Histogram()
+
+    def __add__(self, other: 'Stats') -> 'Stats':
+        result = Stats()
+        result.merge(other=self)
+        result.merge(other=other)
+        return result
+
+    def merge(self, other: 'Stats') -> 'Stats':
+        """
+        Add statistics of other documents.
+
+        Args:
+            other: partial statistics
+
+        Returns:
+            This object.
+        """
+        for name in self.counters:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.merged_cells.update(other.merged_cells)
+        self.styles.update(other.styles)
+        self.errors.update(other.errors)
+        self.paragraph_length.merge(other=other.paragraph_length)
+        self.document_length.merge(other=other.document_length)
+        return self
+
+    @property
+    def to_dict(self) -> dict:
+        """Get dictionary representation of the statistics."""
+
+        data = {name: getattr(self, name) for name in self.counters}
+        data.update(
+            {
+                'merged_cells': dict(self.merged_cells),
+                'styles': dict(self.styles.most_common()),
+                'errors': dict(self.errors),
+                'paragraph_length': self.paragraph_length.to_dict,
+                'document_length': self.document_length.to_dict,
+            },
+        )
+        return data
+
+    def report(self, top_styles: int = TOP_STYLES) -> str:
+        """
+        Get text summary.
+
+        Args:
+            top_styles: number of most used paragraph styles to list
+        """
+        failed = sum(self.errors.values())
+        lines = [f'documents: {self.documents} ({failed} failed)']
+        for name in self.counters[1:]:
+            per_document = getattr(self, name) / self.documents if self.documents else 0
+            lines.append(f'{name}: {getattr(self, name)} ({per_document:.1f} per document)')
+        lines.append(
+            'merged cells: {h} horizontal, {v} vertical'.format(
+                h=self.merged_cells['horizontal'], v=self.merged_cells['vertical'],
+            ),
+        )
+        for name in ('paragraph_length', 'document_length'):
+            histogram = getattr(self, name)
+            lines.append(
+                '{name}: mean {mean:.1f}, p50 <= {p50}, p90 <= {p90}, max {max}'.format(
+                    name=name.replace('_', ' '),
+                    mean=histogram.mean,
+                    p50=histogram.quantile(q=0.5),
+                    p90=histogram.quantile(q=0.9),
+                    max=histogram.maximum,
+                ),
+            )
+        if self.styles:
+            lines.append('styles:')
+            lines.extend(
+                f'  {style}: {count}'
+                for style, count in self.styles.most_common(top_styles)
+            )
+        if self.errors:
+            lines.append('errors:')
+            lines.extend(f'  {error}: {count}' for error, count in self.errors.most_common())
+        return '\n'.join(lines)
+
+
+def collect(
+    file_or_path: Union[str, IO], profile: Optional[ParserProfile] = None,
+) -> Stats:
+    """
+    Collect statistics of a document in one streaming pass.
+
+    Args:
+        file_or_path: file or path to file
+        profile: xml parser options and resource limits
+
+    Returns:
+        Statistics of the document.
+    """
+    stats = Stats()
+    session = (DEFAULT_PROFILE if profile is None else profile).session()
+    paragraphs = []
+    runs = 0
+    document_length = 0
+    with Package(file_or_path) as package:
+        with package.open(name=DOCUMENT_PATH, session=session) as content:
+            for event, element in session.iterparse(source=content):
+                tag = element.tag
+                if event == 'start':
+                    if tag == PARAGRAPH:
+                        paragraphs.append([0, DEFAULT_STYLE])
+                    elif tag == RUN:
+                        runs += 1
+                    continue
+                counter = COUNTED.get(tag)
+                if counter is not None:
+                    setattr(stats, counter, getattr(stats, counter) + 1)
+                if tag == TEXT:
+                    if paragraphs and element.text:
+                        paragraphs[-1][0] += len(element.text)
+                elif tag in CHAR_TAGS:
+                    # tab stops of paragraph properties are not characters
+                    if paragraphs and runs:
+                        paragraphs[-1][0] += 1
+                elif tag == PSTYLE:
+                    if paragraphs:
+                        paragraphs[-1][1] = element.get(VAL) or DEFAULT_STYLE
+                elif tag == GRID_SPAN:
+                    if int(element.get(VAL, 1)) > 1:
+                        stats.merged_cells['horizontal'] += 1
+                elif tag == V_MERGE:
+                    stats.merged_cells['vertical'] += 1
+                elif tag == RUN:
+                    runs -= 1
+                elif tag == PARAGRAPH:
+                    length, style = paragraphs.pop()
+                    stats.paragraph_length.add(value=length)
+                    stats.styles[style] += 1
+                    document_length += length
+                if tag in BLOCKS:
+                    element.clear()
+                    parent = element.getparent()
+                    while element.getprevious() is not None:
+                        del parent[0]
+    stats.documents = 1
+    stats.document_length.add(value=document_length)
+    return stats
+
+
+def collect_many(paths: Iterable, profile: Optional[ParserProfile] = None) -> Stats:
+    """
+    Collect merged statistics of documents, counting failed ones by error.
+
+    Args:
+        paths: files or paths to files
+        profile: xml parser options and resource limits
+    """
+    stats = Stats()
+    for path in paths:
+        try:
+            stats.merge(other=collect(file_or_path=path, profile=profile))
+        except Exception as error:
+            stats.errors[error.__class__.__name__] += 1
+    return stats
+
+
+def collect_corpus(
+    paths: Iterable,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    batch_size: int = BATCH_SIZE,
+    profile: Optional[ParserProfile] = None,
+) -> Stats:
+    """
+    Collect statistics of a corpus in worker processes.
+
+    Paths are sent to workers in batches, at most two batches per worker
+    are pending, so memory does not grow with corpus size.
+
+    Args:
+        paths: paths to files, may be a lazy iterable
+        workers: number of worker processes, defaults to CPU count, or
+            number of workers of the given executor, defaults to 1
+        executor: executor to run batches on instead of a new process pool
+        batch_size: number of documents per task
+        profile: xml parser options and resource limits
+
+    Returns:
+        Merged statistics, failed documents are counted in `errors`.
+    """
+    if executor is None:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return collect_corpus(
+                paths=paths,
+                workers=workers,
+                executor=pool,
+                batch_size=batch_size,
+                profile=profile,
+            )
+    workers = workers or 1
+    stats = Stats()
+    pending = set()
+    for batch in _batches(paths=paths, size=batch_size):
+        if len(pending) >= workers * 2:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                stats.merge(other=future.result())
+        pending.add(executor.submit(collect_many, batch, profile))
+    for future in pending:
+        stats.merge(other=future.result())
+    return stats
+
+
+def _batches(paths: Iterable, size: int) -> Iterator[list]:
+    paths = iter(paths)
+    while True:
+        batch = list(islice(paths, size))
+        if not batch:
+            return
+        yield batch
@@ -0,0 +1,149 @@
+"""Streaming document parsing in bounded memory."""
+
+from typing import IO, Iterator, Optional, Union
+
+from dxpars.base.base_objects import DocxPart, ParseContext, XmlElement
+from dxpars.chunks import Chunk, iter_chunks as iter_blocks_chunks
+from dxpars.docx_objects.paragraph import Paragraph
+from dxpars.docx_objects.table import Table
+from dxpars.package import DOCUMENT_PATH, RELS_PATH, STYLES_PATH, Package
+from dxpars.parser import DEFAULT_PROFILE, ParserProfile, ParseSession
+from dxpars.relationships import Relationships
+from dxpars.styles import Styles
+
+
+class Blocks(DocxPart):
+    """Paragraphs and tables inside a body-level container (w:sdt etc.)."""
+
+    tag = 'sdt'
+
+    def __init__(self, xml_element, context: Optional[ParseContext] = None):
+        """
+        Create Blocks instance.
+
+        Args:
+            xml_element: container xml
+            context: shared parsing context
+        """
+        super().__init__(
+            xml_element=xml_element,
+            formatting=None,
+            nodes=(Paragraph, Table),
+            context=context,
+        )
+
+    @property
+    def text(self) -> str:
+        return '\n'.join([part.text for part in self._nodes])
+
+    @property
+    def show(self) -> list:
+        return [part.show for part in self._nodes]
+
+    @property
+    def properties(self):
+        return None
+
+
+def read_context(
+    package: Package,
+    session: ParseSession,
+    insertions: bool = True,
+    deletions: bool = False,
+) -> ParseContext:
+    """
+    Read relationships and styles of the package.
+
+    Args:
+        package: open docx package
+        session: parser limits accounting
+        insertions: include text of tracked insertions
+        deletions: include text of tracked deletions
+    """
+    return ParseContext(
+        rels=Relationships(xml_element=package.xml(name=RELS_PATH, session=session)),
+        styles=Styles(xml_element=package.xml(name=STYLES_PATH, session=session)),
+        insertions=insertions,
+        deletions=deletions,
+    )
+
+
+def iter_blocks(
+    file_or_path: Union[str, IO],
+    insertions: bool = True,
+    deletions: bool = False,
+    profile: Optional[ParserProfile] = None,
+) -> Iterator[Union[Paragraph, Table]]:
+    """
+    Iterate over body paragraphs and tables without building the whole tree.
+
+    Each block is released when the next one is requested, so do not keep
+    references to yielded objects.
+
+    Args:
+        file_or_path: file or path to file
+        insertions: include text of tracked insertions
+        deletions: include text of tracked deletions
+        profile: xml parser options and resource limits
+
+    Raises:
+        LimitError: if the document exceeds profile limits
+    """
+    body_tag = f'{XmlElement.namespace}body'
+    block_tags = {f'{XmlElement.namespace}{node.tag}': node for node in (Paragraph, Table)}
+    session = (DEFAULT_PROFILE if profile is None else profile).session()
+    with Package(file_or_path) as package:
+        context = read_context(
+            package=package, session=session, insertions=insertions, deletions=deletions,
+        )
+        with package.open(name=DOCUMENT_PATH, session=session) as content:
+            body = None
+            for event, element in session.iterparse(source=content):
+                if event == 'start':
+                    if body is None and element.tag == body_tag:
+                        body = element
+                    continue
+                if body is None or element.getparent() is not body:
+                    continue
+                block = block_tags.get(element.tag)
+                if block is not None:
+                    yield block(xml_element=element, context=context)
+                elif element.tag in context.containers:
+                    yield from Blocks(xml_element=element, context=context)._nodes
+                element.clear()
+                while element.getprevious() is not None:
+                    del body[0]
+
+
+def iter_chunks(
+    file_or_path: Union[str, IO],
+    by: str = 'heading',
+    max_chars: Optional[int] = None,
+    overlap: int = 0,
+    insertions: bool = True,
+    deletions: bool = False,
+    profile: Optional[ParserProfile] = None,
+) -> Iterator[Chunk]:
+    """
+    Split document into chunks while streaming the body.
+
+    Args:
+        file_or_path: file or path to file
+        by: start chunks at each heading ('heading') or section ('section')
+        max_chars: maximum chunk length
+        overlap: number of characters repeated between pieces of a chunk
+        insertions: include text of tracked insertions
+        deletions: include text of tracked deletions
+        profile: xml parser options and resource limits
+    """
+    yield from iter_blocks_chunks(
+        blocks=iter_blocks(
+            file_or_path=file_or_path,
+            insertions=insertions,
+            deletions=deletions,
+            profile=profile,
+        ),
+        by=by,
+        max_chars=max_chars,
+        overlap=overlap,
+    )
@@ -0,0 +1,109 @@
+"""Docx document styles."""
+
+import re
+from typing import Optional
+
+from lxml.etree import ElementBase
+
+from dxpars.base.base_objects import XmlElement
+from dxpars.data import BODY_TEXT_LEVEL
+from dxpars.parser import DEFAULT_PROFILE, ParseSession
+
+HEADING_NAME = re.compile(r'^heading\s*(\d)$', re.IGNORECASE)
+
+
+class Styles(XmlElement):
+    """Paragraph styles (word/styles.xml)."""
+
+    tag = 'style'
+
+    def __init__(self, xml_element: Optional[ElementBase]):
+        """
+        Create Styles instance.
+
+        Args:
+            xml_element: styles xml tree
+        """
+        super().__init__(xml_element=xml_element)
+        self._styles = {}
+        self._levels = {}
+        if self._xml is not None:
+            for node in self._xml.iterchildren(self._make_tag(tag=self.tag)):
+                if node.get(self._make_tag(tag='type')) != 'paragraph':
+                    continue
+                self._styles[node.get(self._make_tag(tag='styleId'))] = {
+                    'name': self._child_value(node=node, path='name'),
+                    'based_on': self._child_value(node=node, path='basedOn'),
+                    'outline_level': self._child_value(node=node, path='pPr/outlineLvl'),
+                }
+
+    @classmethod
+    def from_bytes(
+        cls, content: Optional[bytes], session: Optional[ParseSession] = None,
+    ) -> 'Styles':
+        """
+        Parse styles part.
+
+        Args:
+            content: part content, None if the part is missing
+            session: parser limits accounting
+        """
+        if content is None:
+            return cls(xml_element=None)
+        if session is None:
+            session = DEFAULT_PROFILE.session()
+        return cls(xml_element=session.parse(content=content))
+
+    def __len__(self) -> int:
+        return len(self._styles)
+
+    def name(self, style_id: Optional[str]) -> Optional[str]:
+        """
+        Get style name.
+
+        Args:
+            style_id: style id
+        """
+        style = self._styles.get(str(style_id))
+        return None if style is None else style['name']
+
+    def outline_level(self, style_id) -> Optional[int]:
+        """
+        Get heading level (0-based) of a paragraph style.
+
+        Uses outlineLvl of the style or its base styles, then the
+        built-in "heading N" style names.
+
+        Args:
+            style_id: style id
+
+        Returns:
+            Outline level, None for body text styles.
+        """
+        if style_id is None:
+            return None
+        style_id = str(style_id)
+        if style_id not in self._levels:
+            self._levels[style_id] = self._resolve_level(style_id=style_id, seen=set())
+        return self._levels[style_id]
+
+    def _resolve_level(self, style_id, seen: set) -> Optional[int]:
+        style = self._styles.get(style_id)
+        if style is None:
+            heading = HEADING_NAME.match(str(style_id))
+            return int(heading.group(1)) - 1 if heading else None
+        if style['outline_level'] is not None:
+            level = int(style['outline_level'])
+            return level if level < BODY_TEXT_LEVEL else None
+        heading = HEADING_NAME.match(style['name'] or '')
+        if heading:
+            return int(heading.group(1)) - 1
+        seen.add(style_id)
+        if style['based_on'] is None or style['based_on'] in seen:
+            return None
+        return self._resolve_level(style_id=style['based_on'], seen=seen)
+
+    def _child_value(self, node: ElementBase, path: str) -> Optional[str]:
+        tags = '/'.join(self._make_tag(tag=tag) for tag in path.split('/'))
+        child = node.find(tags)
+        return None if child is None else child.get(self._make_tag(tag='val'))
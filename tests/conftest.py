@@ -0,0 +1,61 @@
+"""Shared test fixtures."""
+
+from io import BytesIO
+from pathlib import Path
+from zipfile import ZipFile
+
+import pytest
+
+from dxpars.document import Document
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+
+
+def build_docx(body: str, rels: str = '', parts: dict = None) -> BytesIO:
+    """
+    Build in-memory docx file.
+
+    Args:
+        body: w:body inner xml
+        rels: Relationship elements of document.xml.rels
+        parts: additional package parts
+    """
+    content = BytesIO()
+    with ZipFile(content, 'w') as zipf:
+        zipf.writestr(
+            'word/document.xml',
+            f'<w:document {NAMESPACES}><w:body>{body}</w:body></w:document>',
+        )
+        zipf.writestr(
+            'word/_rels/document.xml.rels',
+            '<Relationships xmlns="http://schemas.openxmlformats.org/'
+            f'package/2006/relationships">{rels}</Relationships>',
+        )
+        for name, data in (parts or {}).items():
+            zipf.writestr(name, data)
+    content.seek(0)
+    return content
+
+
+@pytest.fixture
+def make_docx():
+    """In-memory docx factory."""
+
+    return build_docx
+
+
+@pytest.fixture
+def test_doc_path() -> str:
+    """Path to the sample docx file."""
+
+    return str(Path(__file__).parent / 'fixtures' / 'test.docx')
+
+
+@pytest.fixture
+def document(test_doc_path) -> Document:
+    """Sample document."""
+
+    return Document(test_doc_path)
@@ -0,0 +1,147 @@
+"""Tests for document chunks."""
+
+from io import BytesIO
+
+import pytest
+
+from dxpars import stream
+from dxpars.chunks import iter_chunks
+from dxpars.document import Document
+
+STYLES = (
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:style w:type="paragraph" w:styleId="Title1"><w:name w:val="heading 1"/></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Sub"><w:name w:val="Sub"/>'
+    '<w:pPr><w:outlineLvl w:val="1"/></w:pPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="SubBased"><w:name w:val="Sub based"/>'
+    '<w:basedOn w:val="Sub"/></w:style>'
+    '</w:styles>'
+)
+
+
+def paragraph(text: str, style: str = None, ppr: str = '') -> str:
+    style = f'<w:pStyle w:val="{style}"/>' if style else ''
+    return f'<w:p><w:pPr>{style}{ppr}</w:pPr><w:r><w:t>{text}</w:t></w:r></w:p>'
+
+
+BODY = ''.join(
+    [
+        paragraph('Intro'),
+        paragraph('Terms', style='Title1'),
+        paragraph('Definitions', style='Sub'),
+        paragraph('word means word'),
+        paragraph('Scope', style='SubBased'),
+        paragraph('everything', ppr='<w:sectPr/>'),
+        paragraph('Payment', style='Heading1'),
+        '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>fee</w:t></w:r></w:p></w:tc></w:tr></w:tbl>',
+        paragraph('Annex', ppr='<w:outlineLvl w:val="0"/>'),
+    ],
+)
+
+
+@pytest.fixture
+def document(make_docx) -> Document:
+    return Document(make_docx(body=BODY, parts={'word/styles.xml': STYLES}))
+
+
+class TestChunks:
+    """Test iter_chunks."""
+
+    def test_heading_chunks(self, document):
+        chunks = list(document.iter_chunks())
+        assert [chunk.headings for chunk in chunks] == [
+            (),
+            ('Terms',),
+            ('Terms', 'Definitions'),
+            ('Terms', 'Scope'),
+            ('Payment',),
+            ('Annex',),
+        ]
+        assert chunks[2].text == 'Definitions\nword means word'
+        assert chunks[4].text.startswith('Payment\nfee')
+        assert (chunks[4].start, chunks[4].end) == (6, 7)
+        assert [chunk.section for chunk in chunks] == [0, 0, 0, 0, 1, 1]
+
+    def test_section_chunks(self, document):
+        chunks = list(document.iter_chunks(by='section'))
+        assert len(chunks) == 2
+        assert chunks[0].text.startswith('Intro\nTerms')
+        assert chunks[1].headings == ('Payment',)
+
+    def test_max_chars(self, document):
+        chunks = list(document.iter_chunks(by='section', max_chars=20, overlap=4))
+        assert len(chunks) > 2
+        assert all(len(chunk.text) <= 20 for chunk in chunks)
+        assert chunks[1].text[:4] == chunks[0].text[-4:]
+        with pytest.raises(ValueError):
+            list(document.iter_chunks(max_chars=10, overlap=10))
+
+    def test_max_chars_streams(self, make_docx):
+        content = make_docx(body=paragraph('twelve chars') * 1000)
+        consumed = []
+
+        def blocks():
+            for block_idx, block in enumerate(stream.iter_blocks(content)):
+                consumed.append(block_idx)
+                yield block
+
+        chunks = iter_chunks(blocks(), max_chars=45, overlap=6)
+        first = next(chunks)
+        assert first.text == 'twelve chars\ntwelve chars\ntwelve chars'
+        assert (first.start, first.end) == (0, 2)
+        assert len(consumed) == 4
+        second = next(chunks)
+        assert second.text.startswith(first.text[-6:] + 'twelve chars')
+        assert len(consumed) == 7
+
+    def test_stream(self, document, make_docx):
+        content = make_docx(body=BODY, parts={'word/styles.xml': STYLES})
+        chunks = [chunk.to_dict for chunk in stream.iter_chunks(content)]
+        assert chunks == [chunk.to_dict for chunk in document.iter_chunks()]
+
+    def test_snapshot(self, document):
+        content = BytesIO()
+        document.dump(content)
+        content.seek(0)
+        loaded = Document.load(content)
+        for by in ('heading', 'section'):
+            assert [chunk.to_dict for chunk in loaded.iter_chunks(by=by)] == [
+                chunk.to_dict for chunk in document.iter_chunks(by=by)
+            ]
+
+    def test_parallel(self, document, make_docx):
+        content = make_docx(body=BODY, parts={'word/styles.xml': STYLES})
+        parsed = Document.parse_parallel(content, workers=1)
+        assert len(parsed.styles) == len(document.styles)
+        for by in ('heading', 'section'):
+            assert [chunk.to_dict for chunk in parsed.iter_chunks(by=by)] == [
+                chunk.to_dict for chunk in document.iter_chunks(by=by)
+            ]
+
+    def test_body_text_level(self, make_docx):
+        body = paragraph('Title', style='Title1') + paragraph(
+            'Note', style='Title1', ppr='<w:outlineLvl w:val="9"/>',
+        ) + paragraph('text')
+        content = make_docx(body=body, parts={'word/styles.xml': STYLES})
+        document = Document(content)
+        assert document.paragraphs[1].outline_level is None
+        assert document.body.detach().parts[1].outline_level is None
+        chunks = [chunk.to_dict for chunk in document.iter_chunks()]
+        assert [chunk['headings'] for chunk in chunks] == [['Title']]
+        content.seek(0)
+        assert [chunk.to_dict for chunk in stream.iter_chunks(content)] == chunks
+
+    def test_stream_tracked_changes(self, make_docx):
+        body = (
+            '<w:p><w:r><w:t>kept</w:t></w:r>'
+            '<w:del><w:r><w:delText> removed</w:delText></w:r></w:del></w:p>'
+        )
+        chunks = list(stream.iter_chunks(make_docx(body=body), deletions=True))
+        assert chunks[0].text == 'kept removed'
+        chunks = list(stream.iter_chunks(make_docx(body=body)))
+        assert chunks[0].text == 'kept'
+
+    def test_stream_blocks(self, make_docx):
+        body = BODY + '<w:sdt><w:sdtContent>' + paragraph('control') + '</w:sdtContent></w:sdt>'
+        texts = [block.text for block in stream.iter_blocks(make_docx(body=body))]
+        assert texts == [part.text for part in Document(make_docx(body=body)).parts]
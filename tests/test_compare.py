@@ -0,0 +1,123 @@
+"""Tests for document diff."""
+
+import time
+
+import pytest
+
+import dxpars
+from dxpars.document import Document
+
+
+def paragraph(*runs: str) -> str:
+    return '<w:p>{runs}</w:p>'.format(
+        runs=''.join(
+            f'<w:r>{"<w:rPr><w:b/></w:rPr>" if run.startswith("*") else ""}'
+            f'<w:t xml:space="preserve">{run.lstrip("*")}</w:t></w:r>'
+            for run in runs
+        ),
+    )
+
+
+def table(*rows: tuple) -> str:
+    return '<w:tbl>{rows}</w:tbl>'.format(
+        rows=''.join(
+            '<w:tr>{cells}</w:tr>'.format(
+                cells=''.join(f'<w:tc>{paragraph(cell)}</w:tc>' for cell in row),
+            )
+            for row in rows
+        ),
+    )
+
+
+BODY_A = ''.join(
+    [
+        paragraph('Agreement'),
+        paragraph('The fee is ', '100', ' EUR.'),
+        paragraph('Removed clause.'),
+        table(('item', 'price'), ('a', '1'), ('b', '2')),
+        paragraph('Signed'),
+    ],
+)
+BODY_B = ''.join(
+    [
+        paragraph('*Agreement'),
+        paragraph('The fee is ', '200', ' EUR.'),
+        table(('item', 'price'), ('a', '3'), ('b', '2'), ('c', '4')),
+        paragraph('Signed'),
+        paragraph('Annex'),
+    ],
+)
+
+
+@pytest.fixture
+def changes(make_docx):
+    return dxpars.diff(Document(make_docx(BODY_A)), Document(make_docx(BODY_B)))
+
+
+class TestDiff:
+    """Test document diff."""
+
+    def test_equal(self, make_docx):
+        assert dxpars.diff(Document(make_docx(BODY_A)), Document(make_docx(BODY_A))) == []
+
+    def test_blocks(self, changes):
+        assert [(change.kind, change.a_index, change.b_index) for change in changes] == [
+            ('format', 0, 0),
+            ('replace', 1, 1),
+            ('delete', 2, None),
+            ('replace', 3, 2),
+            ('insert', None, 4),
+        ]
+        assert changes[0].properties == {'bold': (False, True)}
+        assert changes[-1].b_text == 'Annex'
+
+    def test_runs(self, changes):
+        run_change, = changes[1].parts
+        assert (run_change.kind, run_change.a_index, run_change.b_index) == ('replace', 1, 1)
+        assert (run_change.a_text, run_change.b_text) == ('100', '200')
+        format_change, = changes[0].parts
+        assert format_change.kind == 'format'
+        assert format_change.properties == {'bold': (False, True)}
+
+    def test_cells(self, changes):
+        assert [
+            (change.kind, change.a_index, change.b_index, change.a_text, change.b_text)
+            for change in changes[3].parts
+        ] == [
+            ('replace', (1, 1), (1, 1), '1', '3'),
+            ('insert', None, (3, 0), None, 'c'),
+            ('insert', None, (3, 1), None, '4'),
+        ]
+
+    def test_detached(self, changes, make_docx):
+        data = Document.parse_parallel(make_docx(BODY_A), workers=1)
+        detached = dxpars.diff(data, Document(make_docx(BODY_B)))
+        assert [change.to_dict for change in detached] == [
+            change.to_dict for change in changes
+        ]
+
+    def test_repeated_blocks(self, make_docx):
+        body_a = paragraph('Title') + '<w:p/>' * 250 + paragraph('End')
+        body_b = paragraph('New title') + '<w:p/>' * 251 + paragraph('New end')
+        changes = dxpars.diff(Document(make_docx(body=body_a)), Document(make_docx(body=body_b)))
+        assert [(change.kind, change.a_index, change.b_index) for change in changes] == [
+            ('replace', 0, 0), ('replace', 251, 251), ('insert', None, 252),
+        ]
+
+    def test_large_repeated_body(self, make_docx):
+        def body(edited: bool) -> str:
+            return ''.join(
+                '<w:p/>' if idx % 3 == 0 else paragraph(
+                    f'clause {idx} edited' if edited and idx % 50 == 1 else f'clause {idx}',
+                )
+                for idx in range(6000)
+            )
+
+        doc_a, doc_b = Document(make_docx(body(False))), Document(make_docx(body(True)))
+        start = time.perf_counter()
+        changes = dxpars.diff(doc_a, doc_b)
+        assert time.perf_counter() - start < 5
+        assert [change.a_index for change in changes] == [
+            idx for idx in range(6000) if idx % 3 and idx % 50 == 1
+        ]
+        assert {change.kind for change in changes} == {'replace'}
@@ -0,0 +1,59 @@
+"""Tests for detached objects."""
+
+import pickle
+
+import pytest
+
+from dxpars.data import ParagraphData, RunData, TableData
+from dxpars.document import Document
+
+
+class TestDetach:
+    """Test detached objects."""
+
+    def test_detach_read_api(self, document):
+        paragraph, table = document.paragraphs[0], document.tables[0]
+        detached_paragraph, detached_table = paragraph.detach(), table.detach()
+        assert isinstance(detached_paragraph, ParagraphData)
+        assert isinstance(detached_paragraph.parts[0], RunData)
+        assert isinstance(detached_table, TableData)
+        for part, detached in ((paragraph, detached_paragraph), (table, detached_table)):
+            assert detached.text == part.text
+            assert detached.properties == part.properties
+            assert detached.to_dict == part.to_dict
+            assert detached.show == part.show
+        assert detached_table.shape == table.shape
+        assert detached_paragraph.bold == paragraph.bold
+        assert detached_paragraph.pstyle == paragraph.pstyle
+
+    def test_pickle(self, document):
+        with pytest.raises(TypeError):
+            pickle.dumps(document.paragraphs[0])
+        body = document.body.detach()
+        restored = pickle.loads(pickle.dumps(body))
+        assert restored == body
+        assert restored.to_dict == document.body.to_dict
+        frozen = pickle.loads(pickle.dumps(document.body.detach(frozen=True)))
+        assert isinstance(frozen.parts, tuple)
+        assert frozen.to_dict == document.body.to_dict
+
+    def test_shared_properties(self, make_docx):
+        body = Document(
+            make_docx(
+                '<w:p><w:r><w:t>a</w:t></w:r><w:r><w:t>b</w:t></w:r></w:p>'
+                '<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>c</w:t></w:r><w:r><w:t>d</w:t></w:r></w:p>',
+            ),
+        ).body.detach()
+        restored = pickle.loads(pickle.dumps(body))
+        runs = [run for paragraph in restored.paragraphs for run in paragraph.parts]
+        assert len({id(run._properties) for run in runs}) == 2
+        # public properties are copies, shared dicts can not be changed
+        runs[0].properties['bold'] = True
+        assert not runs[1].bold
+
+    def test_detach_unsupported(self, make_docx):
+        paragraph = Document(
+            make_docx('<w:p><w:hyperlink w:anchor="x"><w:r><w:t>a</w:t></w:r></w:hyperlink></w:p>'),
+        ).paragraphs[0]
+        with pytest.raises(TypeError):
+            paragraph.hyperlinks[0].detach()
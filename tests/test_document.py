@@ -70,3 +70,17 @@ class TestDocument:
         document.to_txt(folder=str(path), filename='test1.txt')
         for doc in doc_names:
             assert (Path(path) / doc).exists()
+
+    def test_block_content_controls(self, make_docx):
+        """Test paragraphs and tables inside block-level content controls."""
+        body = (
+            '<w:p><w:r><w:t>first</w:t></w:r></w:p>'
+            '<w:sdt><w:sdtContent>'
+            '<w:p><w:r><w:t>second</w:t></w:r></w:p>'
+            '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+            '</w:sdtContent></w:sdt>'
+        )
+        document = Document(make_docx(body=body))
+        assert [p.text for p in document.paragraphs] == ['first', 'second']
+        assert len(document.tables) == 1
+        assert document.tables[0].text.strip() == 'cell'
@@ -0,0 +1,114 @@
+"""Tests for Markdown and HTML export."""
+
+from io import StringIO
+
+import pytest
+
+from dxpars.document import Document
+
+STYLES = (
+    '<w:styles xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:style w:type="paragraph" w:styleId="Title1"><w:name w:val="heading 1"/></w:style>'
+    '</w:styles>'
+)
+BULLET = '<w:pPr><w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr></w:pPr>'
+
+
+def cell(text: str, tcpr: str = '') -> str:
+    return f'<w:tc><w:tcPr>{tcpr}</w:tcPr><w:p><w:r><w:t>{text}</w:t></w:r></w:p></w:tc>'
+
+
+BODY = ''.join(
+    [
+        '<w:p><w:pPr><w:pStyle w:val="Title1"/></w:pPr><w:r><w:t>Terms</w:t></w:r></w:p>',
+        '<w:p><w:r><w:t xml:space="preserve">Plain </w:t></w:r>'
+        '<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">bold </w:t></w:r>'
+        '<w:r><w:rPr><w:b/></w:rPr><w:t>text</w:t></w:r>'
+        '<w:r><w:rPr><w:i/><w:u w:val="single"/></w:rPr><w:t>*x*</w:t></w:r></w:p>',
+        f'<w:p>{BULLET}<w:r><w:t>one</w:t></w:r></w:p>',
+        f'<w:p>{BULLET}<w:r><w:t>two</w:t></w:r></w:p>',
+        '<w:p/>',
+        '<w:tbl>',
+        '<w:tr>' + cell('a', '<w:gridSpan w:val="2"/>') + cell('b') + '</w:tr>',
+        '<w:tr>' + cell('c', '<w:vMerge w:val="restart"/>') + cell('d') + cell('e') + '</w:tr>',
+        '<w:tr>' + cell('', '<w:vMerge/>') + cell('f') + cell('g') + '</w:tr>',
+        '</w:tbl>',
+    ],
+)
+
+
+@pytest.fixture
+def document(make_docx):
+    return Document(make_docx(BODY, parts={'word/styles.xml': STYLES}), filename='doc')
+
+
+class TestExport:
+    """Test Markdown and HTML writers."""
+
+    def test_markdown(self, document):
+        output = StringIO()
+        document.to_markdown(output)
+        assert output.getvalue() == (
+            '# Terms\n\n'
+            'Plain **bold text**_<u>\\*x\\*</u>_\n\n'
+            '- one\n'
+            '- two\n\n'
+            '| a |  | b |\n'
+            '|---|---|---|\n'
+            '| c | d | e |\n'
+            '|  | f | g |\n\n'
+        )
+
+    def test_adjacent_emphasis(self, make_docx):
+        runs = [
+            ('', 'Plain '), ('<w:i/>', 'italic'), ('<w:b/><w:i/>', 'both'),
+            ('<w:b/>', ' bold'), ('', ' '), ('<w:b/>', 'again'), ('<w:i/>', 'x'),
+        ]
+        body = '<w:p>{runs}</w:p>'.format(
+            runs=''.join(
+                f'<w:r><w:rPr>{rpr}</w:rPr><w:t xml:space="preserve">{text}</w:t></w:r>'
+                for rpr, text in runs
+            ),
+        )
+        output = StringIO()
+        Document(make_docx(body)).to_markdown(output)
+        assert output.getvalue() == 'Plain *italic*__*both* bold again__*x*\n\n'
+        output = StringIO()
+        Document(make_docx(body)).to_html(output)
+        assert (
+            '<p>Plain <em>italic</em><strong><em>both</em> bold again</strong><em>x</em></p>'
+        ) in output.getvalue()
+
+    def test_nested_table(self, make_docx):
+        nested = '<w:tbl><w:tr>' + cell('x') + cell('y') + '</w:tr></w:tbl>'
+        body = '<w:tbl><w:tr>' + cell('a') + f'<w:tc><w:p/>{nested}</w:tc>' + '</w:tr></w:tbl>'
+        output = StringIO()
+        Document(make_docx(body)).to_markdown(output)
+        assert output.getvalue() == '| a | <br>x<br>y |\n|---|---|\n\n'
+
+    def test_html(self, document):
+        output = StringIO()
+        document.to_html(output)
+        html = output.getvalue()
+        assert html.startswith('<!DOCTYPE html>')
+        body = html[html.index('<body>\n') + 7:html.index('</body>')]
+        assert body == (
+            '<h1>Terms</h1>\n'
+            '<p>Plain <strong>bold text</strong><em><u>*x*</u></em></p>\n'
+            '<ul>\n<li>one</li>\n<li>two</li>\n</ul>\n'
+            '<table>\n'
+            '<tr><td colspan="2"><p>a</p>\n</td><td><p>b</p>\n</td></tr>\n'
+            '<tr><td rowspan="2"><p>c</p>\n</td><td><p>d</p>\n</td><td><p>e</p>\n</td></tr>\n'
+            '<tr><td><p>f</p>\n</td><td><p>g</p>\n</td></tr>\n'
+            '</table>\n'
+        )
+
+    def test_detached(self, document, make_docx, tmp_path):
+        data = Document.parse_parallel(
+            make_docx(BODY, parts={'word/styles.xml': STYLES}), workers=1,
+        )
+        document.to_html(tmp_path / 'a.html')
+        data.to_html(tmp_path / 'b.html')
+        a, b = (tmp_path / 'a.html').read_text(), (tmp_path / 'b.html').read_text()
+        assert '<h1>Terms</h1>' in b
+        assert a.split('<body>')[1] == b.split('<body>')[1]
@@ -0,0 +1,52 @@
+"""Tests for property frames."""
+
+import pytest
+
+from dxpars import frames
+
+
+class TestFrames:
+    """Test run and paragraph frames."""
+
+    def test_runs_frame(self, document):
+        runs = document.runs_frame()
+        assert len(runs) == len(runs['bold']) == len(runs['length'])
+        bold = runs.select(runs['bold'])
+        assert [run.text for run in bold] == ['PARAGRAPH WITH TEXT']
+        blocks = list(runs['block'])
+        assert blocks[0] == 0
+        assert blocks == sorted(blocks)
+        assert set(blocks) == {0, 1, 2}
+
+    def test_paragraphs_frame(self, document):
+        paragraphs = document.paragraphs_frame()
+        runs = document.runs_frame()
+        assert paragraphs.objects[0] is document.paragraphs[0]
+        assert len(paragraphs) > len(document.paragraphs)
+        code = paragraphs.code('style', 'Style_1')
+        assert code >= 0
+        assert list(paragraphs['style']).count(code) == 1
+        assert paragraphs.code('alignment', 'center') == list(paragraphs['alignment'])[0]
+        assert sum(paragraphs['length']) == sum(runs['length'])
+        for idx, paragraph in enumerate(paragraphs.objects):
+            assert bool(paragraphs['bold'][idx]) == paragraph.bold
+            assert bool(paragraphs['caps'][idx]) == paragraph.caps
+
+    def test_columns_read_only(self, document):
+        numpy = pytest.importorskip('numpy')
+        runs = document.runs_frame()
+        assert isinstance(runs['bold'], numpy.ndarray)
+        with pytest.raises(ValueError):
+            runs['bold'][0] = True
+        assert document.runs_frame()['bold'][0] == runs['bold'][0]
+
+    def test_without_numpy(self, document, monkeypatch):
+        monkeypatch.setattr(frames, 'numpy', None)
+        runs = document.runs_frame()
+        assert runs['bold'].typecode == 'B'
+        bold = runs['bold'][0]
+        runs['bold'][0] = not bold
+        runs['length'].append(1)
+        again = document.runs_frame()
+        assert again['bold'][0] == bold
+        assert len(again['length']) == len(runs['length']) - 1
@@ -0,0 +1,99 @@
+"""Tests for frozen documents shared between threads."""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dxpars import document as document_module
+from dxpars.document import Document
+
+THREADS = 16
+ROUNDS = 20
+
+
+@pytest.fixture
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def read_all(document: Document) -> tuple:
+    return (
+        document.text,
+        document.to_dict,
+        [
+            {
+                row_idx: {cell_idx: cell.text for cell_idx, cell in row.items()}
+                for row_idx, row in table.expand.items()
+            }
+            for table in document.tables
+        ],
+        [(match.block, match.start) for match in document.find('paragraph')],
+        document.locate(offset=3).start,
+        list(document.runs_frame()['length']),
+    )
+
+
+class TestFrozen:
+    """Test frozen documents."""
+
+    def test_freeze(self, document):
+        expected = document.to_dict
+        expected_merge = document.tables[0]._nodes[0]._nodes[0].formatting.v_merge
+        assert document.freeze() is document
+        assert document.frozen
+        assert document.to_dict == expected
+        assert isinstance(document.parts, tuple)
+        with pytest.raises(AttributeError):
+            document.body = None
+        with pytest.raises(AttributeError):
+            document.styles = None
+        cell = document.tables[0]._nodes[0]._nodes[0]
+        cell.v_merge['merged'] = 'changed'
+        cell.properties['v_merge']['first'] = 'changed'
+        assert cell.v_merge == expected_merge
+        assert document.to_dict == expected
+
+    def test_frozen_headings(self, make_docx):
+        body = (
+            '<w:p><w:pPr><w:outlineLvl w:val="0"/></w:pPr><w:r><w:t>Title</w:t></w:r></w:p>'
+            '<w:p><w:pPr><w:sectPr/></w:pPr><w:r><w:t>text</w:t></w:r></w:p>'
+            '<w:p><w:r><w:t>next</w:t></w:r></w:p>'
+        )
+        document = Document(make_docx(body))
+        expected = [chunk.to_dict for chunk in document.iter_chunks(by='section')]
+        document.freeze()
+        assert [chunk.to_dict for chunk in document.iter_chunks(by='section')] == expected
+
+    def test_concurrent_reads(self, document, monkeypatch, switch_often):
+        expected = read_all(document=Document(document.filename))
+        document.freeze()
+
+        builds = []
+        text_index = document_module.TextIndex
+
+        def counting_index(*args, **kwargs):
+            builds.append(threading.get_ident())
+            return text_index(*args, **kwargs)
+
+        monkeypatch.setattr(document_module, 'TextIndex', counting_index)
+        barrier = threading.Barrier(THREADS)
+
+        def hammer(_) -> list:
+            barrier.wait()
+            return [read_all(document=document) for _ in range(ROUNDS)]
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = [
+                result
+                for thread_results in executor.map(hammer, range(THREADS))
+                for result in thread_results
+            ]
+
+        assert len(results) == THREADS * ROUNDS
+        assert all(result == expected for result in results)
+        assert len(builds) == 1
@@ -0,0 +1,50 @@
+"""Tests for document text index."""
+
+import re
+
+from dxpars.document import Document
+from dxpars.docx_objects.table import Cell
+
+
+class TestTextIndex:
+    """Test TextIndex class."""
+
+    def test_build_index(self, document):
+        index = document.build_index()
+        assert 'paragraph' in index.terms
+        assert len(index) > 0
+
+    def test_find_term(self, document):
+        matches = document.find('Paragraph')
+        assert len(matches) == 2
+        match = matches[0]
+        assert match.block == 0
+        assert match.paragraph is document.paragraphs[0]
+        assert match.run is document.paragraphs[0].parts[0]
+        assert match.cell is None
+        assert (match.start, match.end) == (0, 9)
+        assert match.text == 'PARAGRAPH'
+
+    def test_find_in_cells(self, document):
+        matches = document.find('cell')
+        assert len(matches) > 2
+        assert all(isinstance(match.cell, Cell) for match in matches)
+        assert {match.block for match in matches} == {1}
+
+    def test_find_phrase(self, document):
+        matches = document.find('with text')
+        assert [match.text for match in matches] == ['WITH TEXT']
+        assert document.find('with cell') == []
+
+    def test_find_regex(self, document):
+        matches = document.find(re.compile(r'Cell \d'))
+        assert [match.text for match in matches][:2] == ['Cell 0', 'Cell 1']
+        assert matches[0].run_offset == 0
+
+    def test_find_after_length_changing_lowercase(self, make_docx):
+        document = Document(make_docx(body='<w:p><w:r><w:t>İstanbul contract</w:t></w:r></w:p>'))
+        matches = document.find('contract')
+        assert [(match.start, match.end, match.text) for match in matches] == [
+            (9, 17, 'contract'),
+        ]
+        assert [match.text for match in document.find('İstanbul')] == ['İstanbul']
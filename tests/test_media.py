@@ -0,0 +1,74 @@
+"""Tests for media parts."""
+
+import pytest
+
+from dxpars.document import Document
+
+RELS = (
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/image" Target="media/image1.png"/>'
+    '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/oleObject" Target="embeddings/sheet.bin"/>'
+    '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/'
+    'officeDocument/2006/relationships/image" Target="http://example.com/a.png" '
+    'TargetMode="External"/>'
+)
+DRAWING = (
+    '<w:drawing><wp:inline xmlns:wp="http://schemas.openxmlformats.org/'
+    'drawingml/2006/wordprocessingDrawing"><wp:docPr id="1" name="Picture 1" '
+    'descr="logo"/><a:graphic xmlns:a="http://schemas.openxmlformats.org/'
+    'drawingml/2006/main"><a:graphicData><a:blip r:embed="rId1"/></a:graphicData>'
+    '</a:graphic></wp:inline></w:drawing>'
+)
+PARTS = {
+    'word/media/image1.png': b'png' * 1000,
+    'word/media/unused.gif': b'gif',
+    'word/embeddings/sheet.bin': b'ole',
+}
+
+
+@pytest.fixture
+def document(make_docx):
+    docx = make_docx(
+        f'<w:p><w:r><w:t>logo:</w:t>{DRAWING}</w:r></w:p>', rels=RELS, parts=PARTS,
+    )
+    with Document(docx) as document:
+        yield document
+
+
+class TestMedia:
+    """Test media parts."""
+
+    def test_media_list(self, document):
+        media = {item.name: item for item in document.media}
+        assert set(media) == set(PARTS)
+        assert media['word/media/image1.png'].rids == ['rId1']
+        assert media['word/media/image1.png'].type == 'image'
+        assert media['word/media/image1.png'].size == 3000
+        assert media['word/embeddings/sheet.bin'].type == 'oleObject'
+        assert media['word/media/unused.gif'].type is None
+        assert 'rId3' not in document.media
+
+    def test_drawing_target(self, document):
+        run = document.paragraphs[0]._nodes[0]
+        assert run.text == 'logo:'
+        drawing, = run.drawings
+        assert drawing.properties == {
+            'target': 'word/media/image1.png', 'name': 'Picture 1', 'description': 'logo',
+        }
+        with document.media.open(drawing.target) as stream:
+            assert stream.read(6) == b'pngpng'
+        with document.media.open('rId2') as stream:
+            assert stream.read() == b'ole'
+
+    def test_extract(self, document, tmp_path):
+        paths = document.media.extract(folder=tmp_path)
+        assert sorted(path.relative_to(tmp_path).as_posix() for path in paths) == sorted(PARTS)
+        assert (tmp_path / 'word/media/image1.png').read_bytes() == PARTS['word/media/image1.png']
+
+    def test_closed(self, document):
+        document.close()
+        with pytest.raises(ValueError):
+            document.media.open('rId1')
+        with pytest.raises(KeyError):
+            document.media.open('rId3')
@@ -0,0 +1,37 @@
+"""Tests for text offset map."""
+
+
+class TestOffsetMap:
+    """Test OffsetMap class."""
+
+    def test_text(self, document):
+        offsets = document.build_offsets()
+        assert offsets.text == document.text
+
+    def test_locate_runs(self, document):
+        text = document.build_offsets().text
+        for offset, char in enumerate(text):
+            location = document.locate(offset)
+            if location is None:
+                assert char in ' \t\n'
+            else:
+                assert location.run.text[location.offset] == char
+
+    def test_locate_paragraph(self, document):
+        location = document.locate(3)
+        assert location.paragraph is document.paragraphs[0]
+        assert location.cell is None
+        assert location.offset == 3
+
+    def test_locate_cell(self, document):
+        offset = document.text.index('Cell 2')
+        location = document.locate(offset + 5)
+        assert location.cell is document.tables[0].parts[1].parts[0]
+        assert location.paragraph.text == 'Cell 2'
+        assert location.run.text[location.offset] == '2'
+
+    def test_span(self, document):
+        offsets = document.build_offsets()
+        start = offsets.text.index('Cell 0')
+        locations = offsets.span(start, start + len('Cell 0\nCell 1'))
+        assert [location.run.text for location in locations] == ['Cell 0', 'Cell 1']
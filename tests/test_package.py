@@ -0,0 +1,97 @@
+"""Tests for docx package access."""
+
+import pytest
+
+from dxpars.document import Document
+from dxpars.package import DOCUMENT_PATH, Package
+from dxpars.parser import LimitError, ParserProfile
+
+CONTENT_TYPES = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Default Extension="PNG" ContentType="image/png"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+BODY = (
+    '<w:p><w:r><w:t>kept</w:t></w:r></w:p>'
+    '<w:p><w:del><w:r><w:delText>deleted</w:delText></w:r></w:del></w:p>'
+)
+
+
+@pytest.fixture
+def docx(make_docx):
+    return make_docx(
+        BODY,
+        parts={'[Content_Types].xml': CONTENT_TYPES, 'word/media/image1.png': b'png'},
+    )
+
+
+class TestPackage:
+    """Test Package class."""
+
+    def test_members(self, docx):
+        with Package(docx) as package:
+            members = package.members
+            assert members is package.members
+            assert set(members) == {
+                '[Content_Types].xml',
+                'word/document.xml',
+                'word/_rels/document.xml.rels',
+                'word/media/image1.png',
+            }
+            image = package.get('word/media/image1.png')
+            assert (image.size, image.content_type) == (3, 'image/png')
+            assert image.offset > 0
+            assert package.content_type('word/document.xml').endswith('main+xml')
+            assert package.content_type('word/_rels/document.xml.rels') is None
+            assert package.get('missing') is None
+
+    def test_xml_cached(self, docx):
+        with Package(docx) as package:
+            assert package.xml('word/document.xml') is package.xml('word/document.xml')
+            assert package.xml('word/styles.xml') is None
+            with pytest.raises(KeyError):
+                package.read('word/styles.xml')
+        assert package.closed
+
+    def test_xml_cached_per_profile(self, docx):
+        with Package(docx) as package:
+            default = package.xml(DOCUMENT_PATH)
+            profile = ParserProfile(remove_blank_text=True)
+            assert package.xml(DOCUMENT_PATH, profile.session()) is not default
+            assert package.xml(DOCUMENT_PATH, profile.session()) is (
+                package.xml(DOCUMENT_PATH, profile.session())
+            )
+            session = ParserProfile(max_elements=1).session()
+            with pytest.raises(LimitError):
+                package.xml(DOCUMENT_PATH, session)
+
+    def test_xml_cached_counts_bytes(self, docx):
+        with Package(docx) as package:
+            size = package.get(DOCUMENT_PATH).size
+            profile = ParserProfile(max_bytes=size)
+            package.xml(DOCUMENT_PATH, profile.session())
+            session = profile.session()
+            package.xml(DOCUMENT_PATH, session)
+            assert session.bytes_read == size
+            with pytest.raises(LimitError):
+                package.xml(DOCUMENT_PATH, session)
+
+    def test_shared_package(self, docx):
+        with Package(docx) as package:
+            inserted = Document(package)
+            deleted = Document(package, deletions=True)
+            assert inserted.text == 'kept\n'
+            assert deleted.text == 'kept\ndeleted'
+            assert inserted.rels is not deleted.rels
+            inserted.close()
+            assert not package.closed
+            assert len(deleted.media) == 1
+        assert package.closed
+
+    def test_document_closes_own_package(self, docx):
+        with Document(docx) as document:
+            assert not document.package.closed
+        assert document.package.closed
@@ -36,3 +36,66 @@ class TestParagraph:
     def test_paragraph_alignment(self, paragraph):
         """Test paragraph style."""
         assert paragraph.alignment == 'center'
+
+
+HYPERLINK_REL = (
+    '<Relationship Id="rId9" Target="https://example.com" TargetMode="External" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"/>'
+)
+CONTAINERS_BODY = (
+    '<w:p>'
+    '<w:r><w:t>See </w:t></w:r>'
+    '<w:hyperlink r:id="rId9"><w:r><w:rPr><w:b/></w:rPr><w:t>site</w:t></w:r></w:hyperlink>'
+    '<w:smartTag><w:r><w:t>, </w:t></w:r></w:smartTag>'
+    '<w:sdt><w:sdtPr><w:rPr><w:i/></w:rPr></w:sdtPr>'
+    '<w:sdtContent><w:r><w:t>control</w:t></w:r></w:sdtContent></w:sdt>'
+    '<w:fldSimple w:instr="PAGE"><w:r><w:t> 1</w:t></w:r></w:fldSimple>'
+    '<w:ins><w:r><w:t> new</w:t></w:r></w:ins>'
+    '<w:del><w:r><w:delText> old</w:delText></w:r></w:del>'
+    '</w:p>'
+)
+
+
+class TestParagraphContainers:
+    """Test text inside inline containers."""
+
+    def test_container_text(self, make_docx):
+        document = Document(make_docx(body=CONTAINERS_BODY, rels=HYPERLINK_REL))
+        assert document.paragraphs[0].text == 'See site, control 1 new'
+
+    def test_tracked_changes_options(self, make_docx):
+        content = make_docx(body=CONTAINERS_BODY, rels=HYPERLINK_REL)
+        document = Document(content, insertions=False, deletions=True)
+        assert document.paragraphs[0].text == 'See site, control 1 old'
+
+    def test_hyperlink_target(self, make_docx):
+        document = Document(make_docx(body=CONTAINERS_BODY, rels=HYPERLINK_REL))
+        paragraph = document.paragraphs[0]
+        hyperlinks = paragraph.hyperlinks
+        assert len(hyperlinks) == 1
+        assert hyperlinks[0].text == 'site'
+        assert hyperlinks[0].target == 'https://example.com'
+        runs = paragraph.parts
+        assert runs[0].hyperlink is None
+        assert runs[1].hyperlink.target == 'https://example.com'
+        assert runs[1].bold
+
+
+class TestSharedFormats:
+    """Test format objects pooling."""
+
+    def test_equal_formats_shared(self, make_docx):
+        body = (
+            '<w:p><w:r><w:rPr><w:b/><w:i/></w:rPr><w:t>a</w:t></w:r>'
+            '<w:r><w:rPr><w:i/><w:b/></w:rPr><w:t>b</w:t></w:r></w:p>'
+            '<w:p><w:r><w:rPr><w:b/><w:i/></w:rPr><w:t>c</w:t></w:r>'
+            '<w:r><w:rPr><w:b w:val="0"/></w:rPr><w:t>d</w:t></w:r></w:p>'
+        )
+        document = Document(make_docx(body=body))
+        first, second = document.paragraphs
+        assert first.parts[0].formatting is second.parts[0].formatting
+        assert first.parts[1].formatting is not first.parts[0].formatting
+        assert len(first.run_formats) == 2
+        assert first.bold and first.italic
+        assert not second.parts[1].bold
+        assert first.formatting is second.formatting
@@ -0,0 +1,67 @@
+"""Tests for parallel document parsing."""
+
+from concurrent.futures import ThreadPoolExecutor
+from zipfile import ZipFile
+
+from dxpars import parallel
+from dxpars.document import Document
+from dxpars.package import DOCUMENT_PATH
+
+BODY = (
+    '<w:p><w:r><w:t>a &lt;w:p&gt; b</w:t></w:r></w:p>'
+    '<!-- <w:p> -->'
+    '<w:tbl><w:tr><w:tc><w:tbl><w:tr><w:tc><w:p/></w:tc></w:tr></w:tbl>'
+    '<w:p><w:r><w:t>cell</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+    '<w:p/>'
+    '<w:sdt><w:sdtContent><w:p><w:r><w:t>sdt</w:t></w:r></w:p></w:sdtContent></w:sdt>'
+    '<w:p w:rsidR="1"><w:r><w:t xml:space="preserve"> last </w:t></w:r></w:p>'
+    '<w:sectPr/>'
+)
+
+
+class TestParallel:
+    """Test parallel parsing."""
+
+    def test_block_spans(self, make_docx):
+        with ZipFile(make_docx(body=BODY)) as zipf:
+            content = zipf.read(DOCUMENT_PATH)
+        head, chunks, tail = parallel.split_body(content=content, chunks=100)
+        assert len(chunks) == 6
+        assert chunks[1].startswith(b'<w:tbl>') and chunks[1].endswith(b'</w:tbl>')
+        assert chunks[-1] == b'<w:sectPr/>'
+        assert head.endswith(b'<w:body>')
+        assert tail.startswith(b'</w:body>')
+
+    def test_self_closing_with_attributes(self, make_docx):
+        body = (
+            '<w:p w:rsidR="00A1" w:rsidRDefault="00B2"/>'
+            '<w:p w:rsidR="00A2"><w:r><w:t>text</w:t></w:r></w:p>'
+            '<w:sectPr/>'
+        )
+        with ZipFile(make_docx(body=body)) as zipf:
+            content = zipf.read(DOCUMENT_PATH)
+        head, chunks, tail = parallel.split_body(content=content, chunks=100)
+        assert chunks == [
+            b'<w:p w:rsidR="00A1" w:rsidRDefault="00B2"/>',
+            b'<w:p w:rsidR="00A2"><w:r><w:t>text</w:t></w:r></w:p>',
+            b'<w:sectPr/>',
+        ]
+        document = Document.parse_parallel(make_docx(body=body), workers=1)
+        assert document.to_dict['body'] == Document(make_docx(body=body)).to_dict['body']
+
+    def test_same_as_serial(self, make_docx):
+        serial = Document(make_docx(body=BODY))
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            document = Document.parse_parallel(
+                make_docx(body=BODY), executor=executor, workers=3,
+            )
+        assert document.text == serial.text
+        assert document.to_dict['body'] == serial.to_dict['body']
+
+    def test_process_pool(self, test_doc_path):
+        serial = Document(test_doc_path)
+        document = Document.parse_parallel(test_doc_path, workers=2)
+        assert document.filename == serial.filename
+        assert document.to_dict == serial.to_dict
+        assert document.tables[0].expand[0][0].text == 'Cell 0\nCell 1'
+
@@ -0,0 +1,52 @@
+"""Tests for parser profiles and limits."""
+
+import threading
+
+import pytest
+
+from dxpars import stream
+from dxpars.document import Document
+from dxpars.parser import LimitError, ParserProfile
+
+BODY = '<w:p><w:r><w:t>first</w:t></w:r></w:p><w:p><w:r><w:t>second</w:t></w:r></w:p>'
+
+
+class TestParserProfile:
+    """Test parser profiles and limits."""
+
+    def test_parser_cached_per_thread(self):
+        profile = ParserProfile()
+        assert profile.parser is profile.parser
+        assert ParserProfile().parser is profile.parser
+        assert ParserProfile(remove_comments=True).parser is not profile.parser
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(profile.parser))
+        thread.start()
+        thread.join()
+        assert other[0] is not profile.parser
+
+    def test_limits_keep_result(self, make_docx):
+        profile = ParserProfile(
+            max_bytes=10 ** 6, max_elements=1000, max_depth=20, timeout=60,
+        )
+        document = Document(make_docx(BODY), profile=profile)
+        assert document.text == Document(make_docx(BODY)).text == 'first\nsecond'
+
+    @pytest.mark.parametrize(
+        'limit, profile',
+        [
+            ('max_bytes', ParserProfile(max_bytes=100)),
+            ('max_elements', ParserProfile(max_elements=5)),
+            ('max_depth', ParserProfile(max_depth=4)),
+            ('timeout', ParserProfile(timeout=0)),
+        ],
+    )
+    def test_limit_exceeded(self, make_docx, limit, profile):
+        with pytest.raises(LimitError) as error:
+            Document(make_docx(BODY), profile=profile)
+        assert error.value.limit == limit
+        assert error.value.value > error.value.maximum
+
+        with pytest.raises(LimitError):
+            list(stream.iter_blocks(make_docx(BODY), profile=profile))
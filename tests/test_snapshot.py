@@ -0,0 +1,71 @@
+"""Tests for document snapshots."""
+
+import json
+from io import BytesIO
+
+import pytest
+
+from dxpars import snapshot
+from dxpars.data import ParagraphData, TableData
+from dxpars.document import Document
+
+
+@pytest.fixture
+def loaded(document) -> Document:
+    content = BytesIO()
+    document.dump(content)
+    content.seek(0)
+    return Document.load(content)
+
+
+class TestSnapshot:
+    """Test snapshot dump and load."""
+
+    def test_roundtrip(self, document, loaded):
+        assert loaded.filename == document.filename
+        assert loaded.text == document.text
+        assert loaded.to_dict == document.to_dict
+        assert loaded.body.show == document.body.show
+
+    def test_loaded_api(self, document, loaded):
+        paragraph = loaded.paragraphs[0]
+        assert isinstance(paragraph, ParagraphData)
+        assert paragraph.properties == document.paragraphs[0].properties
+        assert paragraph.pstyle == 'Style_1'
+        assert paragraph.parts[0].bold
+        table = loaded.tables[0]
+        assert isinstance(table, TableData)
+        assert table.shape == (2, 2)
+        assert table.expand[0][0] is table.expand[0][1]
+        assert table.parts[1].parts[1].tables[0].text == document.tables[0].parts[1].parts[1].tables[0].text
+
+    def test_loaded_search(self, document, loaded):
+        assert len(loaded.find('cell')) == len(document.find('cell'))
+        assert loaded.build_offsets().text == document.text
+
+    def test_compact(self, document):
+        content = snapshot.dumps(document)
+        assert len(content) < len(json.dumps(document.to_dict))
+        assert snapshot.loads(content).to_dict == document.to_dict
+
+    def test_invalid(self):
+        with pytest.raises(snapshot.SnapshotError):
+            snapshot.loads(b'not a snapshot')
+        with pytest.raises(snapshot.SnapshotError):
+            snapshot.loads(b'DXPS\x01\x05')
+
+    def test_truncated(self, document):
+        content = snapshot.dumps(document)
+        magic = len(snapshot.MAGIC)
+        for length in (magic, magic + 1, len(content) // 2, len(content) - 1):
+            with pytest.raises(snapshot.SnapshotError):
+                snapshot.loads(content[:length])
+
+    def test_truncated_string(self):
+        with pytest.raises(snapshot.SnapshotError, match='Truncated'):
+            snapshot.loads(snapshot.MAGIC + bytes([snapshot.VERSION]) + b'\x01\x05ab')
+
+    def test_trailing_data(self, document):
+        content = snapshot.dumps(document)
+        with pytest.raises(snapshot.SnapshotError):
+            snapshot.loads(content + b'\x00')
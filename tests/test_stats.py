@@ -0,0 +1,107 @@
+"""Tests for corpus statistics."""
+
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import pytest
+
+from dxpars import stats
+from dxpars.document import Document
+
+BODY = (
+    '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Title</w:t></w:r></w:p>'
+    '<w:p><w:r><w:t>one</w:t><w:tab/></w:r><w:r><w:t>two</w:t></w:r></w:p>'
+    '<w:tbl><w:tr>'
+    '<w:tc><w:tcPr><w:gridSpan w:val="2"/></w:tcPr><w:p><w:r><w:t>a</w:t></w:r></w:p></w:tc>'
+    '</w:tr><w:tr>'
+    '<w:tc><w:tcPr><w:vMerge w:val="restart"/></w:tcPr><w:p/></w:tc>'
+    '<w:tc><w:p><w:r><w:t>b</w:t></w:r></w:p></w:tc>'
+    '</w:tr></w:tbl>'
+)
+
+
+def walk(parts) -> list:
+    """Get all paragraphs and tables, including nested ones."""
+
+    nodes = []
+    for part in parts:
+        nodes.append(part)
+        if part.tag == 'tbl':
+            for row in part._nodes:
+                for cell in row._nodes:
+                    nodes.extend(walk(parts=cell._nodes))
+    return nodes
+
+
+class TestStats:
+    """Test statistics collection."""
+
+    def test_collect(self, make_docx):
+        result = stats.collect(make_docx(BODY))
+        assert {name: getattr(result, name) for name in stats.Stats.counters} == {
+            'documents': 1, 'paragraphs': 5, 'runs': 5, 'tables': 1, 'rows': 2, 'cells': 3,
+        }
+        assert result.merged_cells == {'horizontal': 1, 'vertical': 1}
+        assert result.styles == {'Heading1': 1, '(default)': 4}
+        assert result.paragraph_length.total == 14
+        assert result.paragraph_length.maximum == 7
+        assert result.document_length.to_dict['max'] == 14
+
+    def test_tab_stops(self, make_docx):
+        body = (
+            '<w:p><w:pPr><w:tabs><w:tab w:val="left" w:pos="720"/>'
+            '<w:tab w:val="right" w:pos="9000"/></w:tabs></w:pPr>'
+            '<w:r><w:t>abc</w:t></w:r></w:p>'
+        )
+        result = stats.collect(make_docx(body))
+        assert result.paragraph_length.total == 3
+        assert Document(make_docx(body)).paragraphs[0].text == 'abc'
+
+    def test_matches_document(self, test_doc_path):
+        result = stats.collect(test_doc_path)
+        nodes = walk(parts=Document(test_doc_path).parts)
+        paragraphs = [node for node in nodes if node.tag == 'p']
+        assert result.tables == len(nodes) - len(paragraphs)
+        assert result.paragraphs == len(paragraphs)
+        assert result.paragraph_length.total == sum(
+            len(paragraph.text) for paragraph in paragraphs
+        )
+
+    def test_merge(self, make_docx):
+        first, second = stats.collect(make_docx(BODY)), stats.collect(make_docx(BODY))
+        merged = first + second
+        assert merged.documents == 2
+        assert merged.paragraphs == 10
+        assert merged.styles['Heading1'] == 2
+        assert merged.paragraph_length.count == 10
+        assert pickle.loads(pickle.dumps(merged)).to_dict == merged.to_dict
+
+    def test_corpus(self, make_docx):
+        docs = [make_docx(BODY) for _ in range(7)] + [BytesIO(b'not a docx')]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            result = stats.collect_corpus(docs, workers=2, executor=executor, batch_size=3)
+        assert result.documents == 7
+        assert result.tables == 7
+        assert result.errors == {'BadZipFile': 1}
+        report = result.report()
+        assert report.startswith('documents: 7 (1 failed)')
+        assert 'Heading1: 7' in report
+
+
+class TestHistogram:
+    """Test Histogram class."""
+
+    @pytest.mark.parametrize('value, bound', [(0, 0), (1, 1), (5, 5), (100, 100)])
+    def test_quantile(self, value, bound):
+        histogram = stats.Histogram()
+        histogram.add(value=value)
+        assert histogram.quantile(q=0.5) == bound
+
+    def test_buckets(self):
+        histogram = stats.Histogram()
+        for value in (1, 2, 3, 5, 6, 40):
+            histogram.add(value=value)
+        assert histogram.quantile(q=0.5) == 3
+        assert histogram.quantile(q=0.9) == 40
+        assert histogram.to_dict['buckets'] == {'<2': 1, '<4': 2, '<8': 2, '<64': 1}